@@ -17,16 +17,24 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
-import copy
 import logging
-from typing import Dict, List
+import threading
+from typing import Dict, List, Tuple, Any, Iterable, Callable, AsyncIterator, TYPE_CHECKING
 
-from container_app_conf.const import DEFAULT_CONFIG_FILE_PATHS
-from container_app_conf.entry import ConfigEntry
+from container_app_conf.const import DEFAULT_CONFIG_FILE_PATHS, RETAIN_ALL, RETAIN_DECLARED, RETAIN_NONE
+from container_app_conf.entry import ConfigEntry, EntrySpec, BoundConfigEntry, UnparsedValue, ConfigChange
 from container_app_conf.formatter import ConfigFormatter, SimpleFormatter
-from container_app_conf.source import DataSource
+from container_app_conf.snapshot import ConfigSnapshot
+from container_app_conf.source import DataSource, MISSING
 from container_app_conf.util import find_duplicates, generate_reference_config, config_entries_to_dict
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from container_app_conf.cache import SnapshotCache
+    from container_app_conf.shared_snapshot import SharedSnapshot
+    from container_app_conf.watch import ConfigWatcher
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -37,39 +45,178 @@ class ConfigBase:
     """
 
     _instances = {}
+    _instances_lock = threading.RLock()
+
+    # entry metadata, computed once per class
+    _entry_specs: Tuple[EntrySpec, ...] = ()
+    # map of (entry declaration -> entry index)
+    _entry_indices: Dict[ConfigEntry, int] = {}
+    _clashing_key_paths: List[str] = []
+
+    # whether values are parsed on first access instead of when loading
+    _lazy: bool = False
+
+    def __init_subclass__(cls, lazy: bool = None, **kwargs):
+        """
+        :param lazy: if True, entry values (including defaults) are only parsed when they are accessed
+                     for the first time, use validate() to force parsing all values
+        """
+        super().__init_subclass__(**kwargs)
+        if lazy is not None:
+            cls._lazy = lazy
+
+        cls._entry_specs = cls._detect_entry_specs()
+        cls._entry_indices = {spec.entry: spec.index for spec in cls._entry_specs}
+
+        key_paths = list(map(lambda x: x.name, cls._entry_specs))
+        cls._clashing_key_paths = list(find_duplicates(key_paths).keys())
+
+        if not cls._lazy:
+            # parse defaults right away to detect invalid values early
+            for spec in cls._entry_specs:
+                spec.entry.default
 
     def __new__(cls, data_sources: List[DataSource] = None,
                 validate: bool = True,
-                singleton: bool = True):
+                singleton: bool = True,
+                snapshot_cache: 'SnapshotCache' = None,
+                executor: 'Executor' = None,
+                retain_source_data: str = RETAIN_ALL):
         """
         Creates a config object and reads configuration.
+        If a singleton instance of this class already exists it is returned as is,
+        all parameters are only taken into account when the singleton is created.
+        Use reload() to read the configuration again.
         :param data_sources: list of data sources to use. The first value that holds a value for a specific
                              config entry overshadows other data sources.
-        :param validate: if validation should be run (can be disabled for tests)
+        :param validate: if validation should be run (can be disabled for tests),
+                         classes using lazy parsing are never validated on construction
         :param singleton: if the returned instance should be a singleton
+        :param snapshot_cache: optional cache used to persist resolved values, if the config class and
+                               all data sources are unchanged, values are restored from the cache
+                               instead of loading data sources
+        :param executor: optional executor used to load all data sources in parallel initially,
+                         the order of data sources still defines their priority.
+                         It is not used by reloads, which load data sources lazily (see reload())
+        :param retain_source_data: which data loaded by data sources is kept in memory once values are resolved,
+                                   RETAIN_ALL (everything), RETAIN_DECLARED (only values of declared entries)
+                                   or RETAIN_NONE (data sources are loaded again when needed)
         """
-        if singleton:
-            if cls._instances.get(cls, None) is None:
-                instance = super(ConfigBase, cls).__new__(cls)
+        if not singleton:
+            return cls._create_instance(data_sources, validate, snapshot_cache, executor, retain_source_data)
+
+        instance = cls._instances.get(cls, None)
+        if instance is not None:
+            return instance
+
+        with cls._instances_lock:
+            # check again, another thread might have created the instance in the meantime
+            instance = cls._instances.get(cls, None)
+            if instance is None:
+                instance = cls._create_instance(data_sources, validate, snapshot_cache, executor, retain_source_data,
+                                                singleton=True)
+                # only publish fully loaded instances
+                instance._bind_declarations()
                 cls._instances[cls] = instance
-            else:
-                instance = cls._instances[cls]
-        else:
-            instance = super(ConfigBase, cls).__new__(cls)
+            return instance
+
+    @classmethod
+    async def acreate(cls, data_sources: List[DataSource] = None,
+                      validate: bool = True,
+                      singleton: bool = True,
+                      snapshot_cache: 'SnapshotCache' = None,
+                      executor: 'Executor' = None,
+                      retain_source_data: str = RETAIN_ALL) -> 'ConfigBase':
+        """
+        Asynchronous counterpart of the constructor, which does not block the event loop
+        while reading configuration. See __new__ for parameter description.
+        """
+        import asyncio
+        import functools
+
+        if singleton:
+            instance = cls._instances.get(cls, None)
+            if instance is not None:
+                return instance
 
-        self = instance
-        self._config_entries = self._find_config_entries()
+        loop = asyncio.get_running_loop()
+        # the constructor makes sure a singleton is only created (and loaded) once,
+        # no matter how many tasks or threads are trying to create it concurrently
+        return await loop.run_in_executor(None, functools.partial(
+            cls, data_sources, validate, singleton, snapshot_cache, executor, retain_source_data))
 
+    @classmethod
+    def attach(cls, shared_snapshot: 'SharedSnapshot', singleton: bool = True) -> 'ConfigBase':
+        """
+        Creates a config object from the values another process has published to the given shared snapshot,
+        without loading any data source. reload() takes over newly published values (if any).
+        :param shared_snapshot: the shared snapshot to read values from
+        :param singleton: if the returned instance should be a singleton
+        :raises ValueError if no values for this config class have been published yet
+        """
         if not singleton:
-            # copy class attribute to instance to overshadow class attributes
-            instance_attributes = {}
-            for name, attribute in self._config_entries.items():
-                attribute_copy = copy.deepcopy(attribute)
-                self.__dict__.setdefault(name, attribute_copy)
-                key = "_".join(attribute.key_path)
-                instance_attributes[key] = attribute_copy
-            # update config_entries list to reflect instance attributes
-            self._config_entries = instance_attributes
+            return cls._attach_instance(shared_snapshot, singleton)
+
+        with cls._instances_lock:
+            instance = cls._instances.get(cls, None)
+            if instance is None:
+                instance = cls._attach_instance(shared_snapshot, singleton)
+                instance._bind_declarations()
+                cls._instances[cls] = instance
+            return instance
+
+    @classmethod
+    def _attach_instance(cls, shared_snapshot: 'SharedSnapshot', singleton: bool) -> 'ConfigBase':
+        """
+        Creates a new config object reading values from the given shared snapshot
+        :param shared_snapshot: the shared snapshot to read values from
+        :param singleton: if the config object is going to be a singleton
+        """
+        instance = cls._create_instance(data_sources=[], singleton=singleton, load=False)
+        instance._shared_snapshot = shared_snapshot
+        instance.load_config(instance._validate)
+        return instance
+
+    @classmethod
+    def _create_instance(cls, data_sources: List[DataSource] = None,
+                         validate: bool = True,
+                         snapshot_cache: 'SnapshotCache' = None,
+                         executor: 'Executor' = None,
+                         retain_source_data: str = RETAIN_ALL,
+                         singleton: bool = False,
+                         load: bool = True) -> 'ConfigBase':
+        """
+        Creates a new config object and reads configuration.
+        See __new__ for parameter description.
+        :param singleton: if the config object is going to be a singleton, see _bind_declarations()
+        :param load: whether to read configuration
+        """
+        if retain_source_data not in [RETAIN_ALL, RETAIN_DECLARED, RETAIN_NONE]:
+            raise ValueError("Invalid retain_source_data value: {}".format(retain_source_data))
+
+        self = super(ConfigBase, cls).__new__(cls)
+        # raises when key paths are clashing
+        self._find_config_entries()
+
+        # entry declarations are shared between all instances of a class,
+        # every instance only holds its own values
+        entry_count = len(cls._entry_specs)
+        # values are only ever replaced as a whole, see ConfigSnapshot
+        self._snapshot = ConfigSnapshot([None] * entry_count, cls._entry_indices)
+        # raw value and index of the data source each value was resolved from
+        self._raw_values = [MISSING] * entry_count
+        self._winners = [None] * entry_count
+        self._config_entries = {}
+        for spec in cls._entry_specs:
+            if singleton:
+                # singletons keep using the declarations
+                self._config_entries[spec.attribute_name] = spec.entry
+                continue
+
+            bound_entry = BoundConfigEntry(spec.entry, self, spec.index)
+            # overshadow the class attribute
+            self.__dict__[spec.attribute_name] = bound_entry
+            self._config_entries[spec.attribute_name] = bound_entry
 
         if data_sources is None:
             # set default data sources
@@ -83,30 +230,432 @@ class ConfigBase:
         else:
             self.data_sources = data_sources
 
-        self.load_config(validate)
+        self._loaded_sources = [False] * len(self.data_sources)
+        self._reload_lock = threading.RLock()
+        self._listeners = []
 
-        return instance
+        self._validate = validate
+        self._snapshot_cache = snapshot_cache
+        self._retain_source_data = retain_source_data
+        # values are taken from another process instead of data sources, see attach()
+        self._shared_snapshot = None
+        self._shared_generation = None
+        if load:
+            self.load_config(validate, executor)
+
+        return self
+
+    def _bind_declarations(self):
+        """
+        Makes the entry declarations of this class read and write the values of this (singleton) instance,
+        so singleton entries are accessible through the class attributes as well.
+        Declarations shared with another config class (f.ex. a parent class) stay bound to the singleton
+        that has been created first, this instance uses its own view on them instead.
+        """
+        for spec in self._entry_specs:
+            bound_entry = BoundConfigEntry(spec.entry, self, spec.index)
+            if spec.entry._binding is None:
+                spec.entry._binding = bound_entry
+                continue
+
+            # overshadow the class attribute
+            self.__dict__[spec.attribute_name] = bound_entry
+            self._config_entries[spec.attribute_name] = bound_entry
+
+    def reload(self, validate: bool = None, executor: 'Executor' = None):
+        """
+        Reads the configuration from all data sources again
+        :param validate: if validation should be run, defaults to the value passed on construction
+        :param executor: optional executor used to load all changed data sources in parallel,
+                         if None, data sources are loaded lazily
+        """
+        if validate is None:
+            validate = self._validate
+        self.load_config(validate, executor)
 
-    def load_config(self, validate: bool):
+    async def aload(self, validate: bool = None, executor: 'Executor' = None):
+        """
+        Asynchronous counterpart of reload(), all blocking work is done in the default executor
+        of the running event loop. Like reload(), it is serialized with other reloads (f.ex. by the watcher).
+        :param validate: if validation should be run, defaults to the value passed on construction
+        :param executor: optional executor used to load all changed data sources concurrently,
+                         if None, data sources are loaded lazily
+        """
+        import asyncio
+
+        if validate is None:
+            validate = self._validate
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.load_config, validate, executor)
+
+    async def changes(self) -> AsyncIterator[ConfigChange]:
+        """
+        Asynchronous stream of value changes caused by reloading the configuration:
+
+            async for change in config.changes():
+                ...
+
+        :return: async iterator of changes
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+
+        def listener(change: ConfigChange):
+            # listeners might be called from other threads (f.ex. the watcher)
+            loop.call_soon_threadsafe(queue.put_nowait, change)
+
+        self.add_change_listener(listener)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.remove_change_listener(listener)
+
+    def load_config(self, validate: bool, executor: 'Executor' = None):
         """
         Loads the configuration from all available sources
+        :param validate: if validation should be run
+        :param executor: optional executor used to load all changed data sources in parallel
+        """
+        self._load_config(validate, executor)
+
+    def _load_config(self, validate: bool, executor: 'Executor' = None):
+        """
+        Loads the configuration
+        :param validate: if validation should be run
+        :param executor: optional executor used to load all changed data sources in parallel,
+                         if None, data sources are (re)loaded lazily
+        """
+        if self._shared_snapshot is not None:
+            with self._reload_lock:
+                changes = self._load_shared_snapshot()
+            self._notify_listeners(changes)
+            return
+
+        with self._reload_lock:
+            fingerprint = None
+            if self._snapshot_cache is not None:
+                fingerprint = self._snapshot_cache.fingerprint(self, validate)
+                if fingerprint is not None:
+                    values = self._snapshot_cache.load(fingerprint)
+                    if values is not None:
+                        self._publish(values)
+                        self._raw_values = [MISSING] * len(values)
+                        self._winners = [None] * len(values)
+                        self._loaded_sources = [False] * len(self.data_sources)
+                        return
+
+            source_indices = self._changed_sources(executor)
+            changes = self._resolve_sources(source_indices, validate)
+
+            if fingerprint is not None:
+                self._snapshot_cache.save(fingerprint, self._snapshot.copy_values())
+
+        self._notify_listeners(changes)
+
+    def _changed_sources(self, executor: 'Executor' = None) -> List[int]:
+        """
+        Determines the data sources that might have changed since they were last loaded
+        and marks them to be loaded again
+        :param executor: optional executor used to load the changed data sources in parallel right away
+        :return: indices of the changed data sources
+        """
+        source_indices = list(filter(
+            lambda x: not self._loaded_sources[x] or self.data_sources[x].has_changed(),
+            range(len(self.data_sources))))
+        for source_index in source_indices:
+            self._loaded_sources[source_index] = False
+
+        if executor is not None:
+            # load in parallel, priority is still given by the order of data sources
+            futures = list(map(lambda x: executor.submit(self.data_sources[x].load), source_indices))
+            for future in futures:
+                future.result()
+            for source_index in source_indices:
+                self._loaded_sources[source_index] = True
+
+        return source_indices
+
+    def _load_shared_snapshot(self) -> List[Tuple[EntrySpec, Any]]:
+        """
+        Takes over the values of the shared snapshot, if a new generation has been published
+        :return: list of (entry, old value) tuples of all entries whose value has changed
+        """
+        if self._shared_snapshot.generation == self._shared_generation:
+            return []
+
+        generation, values = self._shared_snapshot.load(self)
+        old_values = self._snapshot.copy_values()
+
+        def raw(value: Any) -> Any:
+            return value.raw if isinstance(value, UnparsedValue) else value
+
+        changes = list(map(lambda x: (x, old_values[x.index]), filter(
+            lambda x: raw(old_values[x.index]) != raw(values[x.index]), self._entry_specs)))
+        self._parse_changed_values(values, changes)
+        self._publish(values)
+        self._shared_generation = generation
+        return changes
+
+    def _reload_sources(self, source_indices: List[int]):
+        """
+        Reloads the given data sources and updates all entries that might be affected by them
+        :param source_indices: indices of the data sources to reload
+        """
+        with self._reload_lock:
+            for source_index in source_indices:
+                self._loaded_sources[source_index] = False
+
+            changes = self._resolve_sources(source_indices, self._validate)
+
+        self._notify_listeners(changes)
+
+    def _resolve_sources(self, source_indices: List[int], validate: bool) -> List[Tuple[EntrySpec, Any]]:
+        """
+        Resolves all entries that might be affected by changes of the given data sources
+        (as well as entries that have never been resolved, have been set manually or have not been validated)
+        :param source_indices: indices of the changed data sources
+        :param validate: if validation should be run
+        :return: list of (entry, old value) tuples of all entries whose value has changed
+        """
+        # entries resolved from higher priority sources can not be affected
+        first_index = min(source_indices, default=len(self.data_sources) + 1)
+        affected = list(filter(
+            lambda x: (self._winners[x.index] is None or self._winners[x.index] >= first_index
+                       or self._raw_values[x.index] is MISSING),
+            self._entry_specs))
+        if len(affected) <= 0:
+            return []
+
+        try:
+            return self._resolve(affected, validate)
+        except Exception:
+            # the changed data sources have to be resolved again by the next reload,
+            # even if they are unchanged by then
+            for source_index in source_indices:
+                self._loaded_sources[source_index] = False
+            raise
+
+    def _resolve(self, specs: Iterable[EntrySpec], validate: bool) -> List[Tuple[EntrySpec, Any]]:
+        """
+        Determines the winning raw value of the given entries and parses those that have changed.
+        Data sources are loaded lazily in order of priority, the first data source
+        holding a value for an entry wins, so every entry is parsed at most once.
+        :param specs: the entries to resolve
+        :param validate: if values that are not provided by any data source should be validated
+        :return: list of (entry, old value) tuples of all entries whose value has changed
+        """
+        # work on copies, so a failing reload doesn't leave anything half updated
+        values = self._snapshot.copy_values()
+        raw_values = list(self._raw_values)
+        sources = list(self._winners)
+        loaded_sources = list(self._loaded_sources)
+
+        winners = {}
+        unresolved = list(specs)
+        for source_index, source in enumerate(self.data_sources):
+            if len(unresolved) <= 0:
+                # lower priority sources can not contribute anything anymore
+                break
+
+            if not loaded_sources[source_index]:
+                source.load()
+                loaded_sources[source_index] = True
+
+            remaining = []
+            for spec in unresolved:
+                value = source.lookup(spec)
+                if value is MISSING:
+                    remaining.append(spec)
+                else:
+                    winners[spec.index] = (source_index, value)
+            unresolved = remaining
+
+        # entries without any value fall back to their default
+        no_source = len(self.data_sources)
+        for spec in unresolved:
+            winners[spec.index] = (no_source, spec.entry._default)
+
+        changes = []
+        for spec, (source_index, raw_value) in map(lambda x: (x, winners[x.index]), specs):
+            sources[spec.index] = source_index
+            old_raw_value = raw_values[spec.index]
+            # 1, 1.0 and True are equal, but might not be parsed the same way
+            if old_raw_value is not MISSING and type(old_raw_value) is type(raw_value) \
+                    and (old_raw_value is raw_value or old_raw_value == raw_value):
+                continue
+
+            is_default = source_index == no_source
+            old_value = values[spec.index]
+            value = self._parse_raw_value(spec, raw_value, is_default, validate)
+            values[spec.index] = value
+            # defaults are not parsed without validation, make sure the next validating load does
+            raw_values[spec.index] = MISSING if is_default and not validate else raw_value
+            if value is not old_value:
+                changes.append((spec, old_value))
+
+        self._parse_changed_values(values, changes)
+        self._raw_values = raw_values
+        self._winners = sources
+        self._loaded_sources = loaded_sources
+        self._publish(values)
+        self._trim_sources()
+        return changes
+
+    def _parse_changed_values(self, values: List[Any], changes: List[Tuple[EntrySpec, Any]]):
+        """
+        Parses the new values of changed entries in lazy mode if there are change listeners,
+        so invalid values fail the reload before anything is published instead of when notifying listeners
+        :param values: the new values, parsed values replace raw ones in place
+        :param changes: list of (entry, old value) tuples
         """
-        for source in reversed(self.data_sources):
-            source.load()
-            for entry in self._config_entries.values():
-                if source.has(entry):
-                    entry.value = source.get(entry)
+        if not self._lazy or len(self._listeners) <= 0:
+            return
 
-        if validate:
-            self.validate()
+        for spec, _ in changes:
+            value = values[spec.index]
+            if type(value) is UnparsedValue:
+                values[spec.index] = spec.entry._parse_value(value.raw)
+
+    def _trim_sources(self):
+        """
+        Frees data held by loaded data sources, according to the retain_source_data setting
+        """
+        if self._retain_source_data == RETAIN_ALL:
+            return
+
+        for source_index, source in enumerate(self.data_sources):
+            if not self._loaded_sources[source_index]:
+                continue
+
+            if self._retain_source_data == RETAIN_NONE:
+                source.release()
+                # the source has to be loaded again before it can be used
+                self._loaded_sources[source_index] = False
+            else:
+                source.prune(self._entry_specs)
+
+    def _parse_raw_value(self, spec: EntrySpec, raw_value: Any, is_default: bool, validate: bool) -> Any:
+        """
+        Parses a raw value (or prepares it to be parsed on access in lazy mode)
+        :param spec: the entry of the value
+        :param raw_value: the raw value
+        :param is_default: whether the raw value is the default of the entry
+        :param validate: if None constraints of default values should be checked
+        :return: the value to store
+        """
+        if is_default and raw_value is not None:
+            return spec.entry._parsed_default if self._lazy else spec.entry.default
+
+        if self._lazy:
+            # None constraints are checked on access
+            return UnparsedValue(raw_value)
+
+        if is_default and not validate:
+            return None
+
+        return spec.entry._parse_value(raw_value)
+
+    def _set_value(self, index: int, new_value: Any):
+        """
+        Sets the value of an entry manually
+        :param index: the index of the entry
+        :param new_value: the new (raw) value
+        """
+        parsed_value = self._entry_specs[index].entry._parse_value(new_value)
+        with self._reload_lock:
+            values = self._snapshot.copy_values()
+            values[index] = parsed_value
+            # make sure the value is resolved again on reload
+            self._raw_values[index] = MISSING
+            self._winners[index] = None
+            self._publish(values)
+
+    def _publish(self, values: List[Any]):
+        """
+        Atomically replaces all values of this config
+        :param values: the new values
+        """
+        self._snapshot = ConfigSnapshot(values, self._entry_indices, self._snapshot.generation + 1)
+
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Returns the current values of this config. Use this to read multiple values that
+        are consistent with each other while the config might be reloaded concurrently:
+
+            snapshot = config.snapshot()
+            snapshot[config.HOST], snapshot[config.PORT]
+
+        :return: an immutable snapshot of all current values
+        """
+        return self._snapshot
+
+    def add_change_listener(self, listener: Callable[[ConfigChange], None]):
+        """
+        Registers a listener that is called for every entry whose value changed when the configuration is reloaded
+        :param listener: the listener to add
+        """
+        self._listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[ConfigChange], None]):
+        """
+        Removes a previously added change listener
+        :param listener: the listener to remove
+        """
+        self._listeners.remove(listener)
+
+    def _notify_listeners(self, changes: List[Tuple[EntrySpec, Any]]):
+        """
+        Notifies all change listeners about the given changes
+        :param changes: list of (entry, old value) tuples
+        """
+        if len(self._listeners) <= 0:
+            return
+
+        for spec, old_value in changes:
+            if type(old_value) is UnparsedValue:
+                try:
+                    old_value = spec.entry._parse_value(old_value.raw)
+                except ValueError:
+                    old_value = old_value.raw
+
+            entry = self._config_entries[spec.attribute_name]
+            change = ConfigChange(entry=entry, old_value=old_value, new_value=entry.value)
+            for listener in list(self._listeners):
+                try:
+                    listener(change)
+                except Exception as ex:
+                    LOGGER.exception(ex)
+
+    def watch(self, interval: float = 1.0) -> 'ConfigWatcher':
+        """
+        Watches the config files of all filesystem data sources and reloads changed sources automatically.
+        Use add_change_listener() to get notified about changed values.
+        :param interval: maximum delay in seconds until a change is detected
+        :return: the (already started) watcher, call stop() on it to stop watching
+        """
+        from container_app_conf.watch import ConfigWatcher
+        watcher = ConfigWatcher(self, interval)
+        watcher.start()
+        return watcher
 
     def validate(self):
         """
         Validates the current configuration and throws an exception if something is wrong
         """
-        # reset all entries to make sure None constraints are fulfilled
-        for entry in self._config_entries.values():
-            entry.value = entry.value
+        # reset all entries to make sure None constraints are fulfilled,
+        # this also forces parsing of all values in lazy mode
+        with self._reload_lock:
+            values = self._snapshot.copy_values()
+            for spec in self._entry_specs:
+                value = values[spec.index]
+                if type(value) is UnparsedValue:
+                    value = value.raw
+                values[spec.index] = spec.entry._parse_value(value)
+            self._publish(values)
 
     def print(self, formatter: ConfigFormatter = None) -> str:
         """
@@ -121,19 +670,41 @@ class ConfigBase:
         return output
 
     def _find_config_entries(self) -> Dict[str, ConfigEntry]:
+        """
+        Returns the config entry constants of this class
+        :return: map of (attribute name -> config entry)
+        """
+        if len(self._clashing_key_paths) > 0:
+            clashing = ", ".join(self._clashing_key_paths)
+            raise ValueError("Key paths must be unique! Clashing paths: {}".format(clashing))
+
+        return {spec.attribute_name: spec.entry for spec in self._entry_specs}
+
+    @classmethod
+    def _detect_entry_specs(cls) -> Tuple[EntrySpec, ...]:
         """
         Detects config entry constants in this class
-        :return: list of config entries
+        :return: metadata of all config entries
         """
-        entries = {}
-        for name, attribute in dict(map(lambda x: (x, getattr(self, x)), dir(self))).items():
-            if isinstance(attribute, ConfigEntry):
-                entries[name] = attribute
+        from container_app_conf.source.env_source import EnvSource
 
-        entry_env_keys = list(map(lambda x: "->".join(x.key_path), entries.values()))
-        duplicates = find_duplicates(entry_env_keys)
-        if len(duplicates) > 0:
-            clashing = ", ".join(duplicates.keys())
-            raise ValueError("Key paths must be unique! Clashing paths: {}".format(clashing))
+        specs = []
+        for name in dir(cls):
+            attribute = getattr(cls, name)
+            if not isinstance(attribute, ConfigEntry):
+                continue
+
+            key_path = tuple(attribute.key_path)
+            env_key = EnvSource.env_key(attribute)
+            specs.append(EntrySpec(
+                index=len(specs),
+                attribute_name=name,
+                name="->".join(key_path),
+                key_path=key_path,
+                key_path_casefold=tuple(map(lambda x: x.casefold(), key_path)),
+                env_key=env_key,
+                env_keys=EnvSource.candidate_keys(env_key),
+                entry=attribute
+            ))
 
-        return entries
+        return tuple(specs)
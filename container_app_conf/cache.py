@@ -0,0 +1,138 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import hashlib
+import logging
+import os
+import pickle
+import re
+import sys
+from pathlib import Path
+from typing import List, Any, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+_ADDRESS_REGEX = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _package_version() -> str:
+    """
+    :return: the installed version of this library
+    """
+    from importlib import metadata
+    try:
+        return metadata.version("container_app_conf")
+    except metadata.PackageNotFoundError:
+        # not installed, f.ex. when running from a source checkout
+        return "unknown"
+
+
+class SnapshotCache:
+    """
+    Persists the resolved values of a config object in a file, so they can be restored
+    on the next start without loading any data source or parsing any value,
+    as long as neither the config class nor the data sources have changed.
+
+    Note: The cache file is unpickled when read, only use locations that are not writable by untrusted users.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        :param path: path of the cache file
+        """
+        self.path = Path(path).expanduser()
+
+    def fingerprint(self, config, validate: bool = True) -> Optional[str]:
+        """
+        Computes a fingerprint over the schema of the given config and the current state of its data sources
+        :param config: the config object
+        :param validate: whether values are validated when loading, snapshots resolved without validation
+                         must not be restored by a validating load
+        :return: fingerprint, or None if one of the data sources does not support fingerprinting
+        """
+        digest = hashlib.sha256()
+        digest.update(self._schema_fingerprint(config).encode())
+        digest.update("validate:{};".format(validate).encode())
+        for source in config.data_sources:
+            source_fingerprint = source.fingerprint(config._entry_specs)
+            if source_fingerprint is None:
+                return None
+            digest.update("{}.{}:{};".format(
+                source.__class__.__module__, source.__class__.__qualname__, source_fingerprint).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _schema_fingerprint(config, include_defaults: bool = True) -> str:
+        """
+        :param config: the config object
+        :param include_defaults: whether to include default values, which (f.ex. when using datetime.now())
+                                 might differ in every process
+        :return: a string describing all entries of the given config
+        """
+        config_class = config.__class__
+        items = ["{}.{}".format(config_class.__module__, config_class.__qualname__), sys.version, _package_version()]
+        for spec in config._entry_specs:
+            entry = spec.entry
+            items.append("{}:{}.{}:{}:{!r}:{}:{}".format(
+                spec.attribute_name,
+                entry.__class__.__module__, entry.__class__.__qualname__,
+                spec.name, entry._default if include_defaults else None, entry._required,
+                # memory addresses (f.ex. of validator functions) differ in every process
+                _ADDRESS_REGEX.sub("", repr(entry._describe_parse_parameters()))
+            ))
+        return "\n".join(items)
+
+    def load(self, fingerprint: str) -> Optional[List[Any]]:
+        """
+        Reads cached values
+        :param fingerprint: the expected fingerprint
+        :return: the cached values, or None if there is no cache file or it doesn't match the given fingerprint
+        """
+        if not self.path.is_file():
+            return None
+
+        try:
+            with open(self.path, 'rb') as file:
+                snapshot = pickle.load(file)
+        except Exception as ex:
+            LOGGER.warning("Ignoring unreadable snapshot cache {}: {}".format(self.path, ex))
+            return None
+
+        if snapshot.get("fingerprint") != fingerprint:
+            return None
+        return snapshot["values"]
+
+    def save(self, fingerprint: str, values: List[Any]):
+        """
+        Writes the given values to the cache file
+        :param fingerprint: the fingerprint the values belong to
+        :param values: the values to cache
+        """
+        try:
+            data = pickle.dumps({"fingerprint": fingerprint, "values": values}, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as ex:
+            LOGGER.warning("Config values can not be cached: {}".format(ex))
+            return
+
+        os.makedirs(self.path.parent, exist_ok=True)
+        # write to a temporary file first to never leave a partially written cache behind
+        tmp_path = self.path.with_name("{}.{}.tmp".format(self.path.name, os.getpid()))
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, self.path)
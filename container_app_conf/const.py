@@ -27,3 +27,11 @@ DEFAULT_CONFIG_FILE_PATHS = [
     "~/.config/",
     "~/"
 ]
+
+# how much of the data loaded by data sources is kept in memory after values have been resolved
+# everything
+RETAIN_ALL = "all"
+# only values of declared config entries
+RETAIN_DECLARED = "declared"
+# nothing, data sources are loaded again when needed
+RETAIN_NONE = "none"
@@ -19,15 +19,30 @@
 #  SOFTWARE.
 import logging
 import re
-from typing import List, Any, Optional
+from typing import List, Any, Optional, NamedTuple, Tuple, Hashable, Union
 
 from container_app_conf.const import KEY_PATH_REGEX
+from container_app_conf.entry.parse_cache import ParseCache, NOT_CACHED
 
 LOGGER = logging.Logger(__name__)
 
 
+class UnparsedValue:
+    """
+    Wraps a raw value that has not been parsed yet
+    """
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: Any):
+        self.raw = raw
+
+
 class ConfigEntry:
     _example = None
+    # caches parsed values of entry types with expensive parsing, None disables caching
+    parse_cache: Optional[ParseCache] = None
+    # view on the values of the singleton config instance declaring this entry (if any)
+    _binding: Optional['BoundConfigEntry'] = None
 
     def __init__(self, key_path: List[str], example: Any = None, description: Optional[str] = None, default: Any = None,
                  required: bool = None, secret: bool = None):
@@ -61,12 +76,30 @@ class ConfigEntry:
 
         self.secret = False if secret is None else secret
 
-        if default is not None:
-            self.default = self._parse_value(default)
-        else:
-            self.default = None
+        # the default is parsed on first access
+        self._default = default
+        self._parsed_default = UnparsedValue(default) if default is not None else None
         self._value = default
 
+    @property
+    def default(self) -> Any:
+        """
+        :return: the (parsed) default value of this config entry
+        """
+        default = self._parsed_default
+        if type(default) is UnparsedValue:
+            default = self._parse_value(default.raw)
+            self._parsed_default = default
+        return default
+
+    @default.setter
+    def default(self, new_default) -> None:
+        """
+        :param new_default: the new default value to set
+        """
+        self._default = new_default
+        self._parsed_default = self._parse_value(new_default) if new_default is not None else None
+
     @property
     def example(self) -> Any:
         return self.default if self.default is not None else self._example
@@ -76,6 +109,9 @@ class ConfigEntry:
         """
         :return: the value of this config entry
         """
+        binding = self._binding
+        if binding is not None:
+            return binding.value
         return self._value
 
     @value.setter
@@ -83,7 +119,11 @@ class ConfigEntry:
         """
         :param new_value: the new value to set
         """
-        self._value = self._parse_value(new_value)
+        binding = self._binding
+        if binding is not None:
+            binding.value = new_value
+        else:
+            self._value = self._parse_value(new_value)
 
     def _parse_value(self, value: Any) -> Optional[Any]:
         """
@@ -98,7 +138,7 @@ class ConfigEntry:
                 self._raise_invalid_value(value, "Value is required")
 
         try:
-            parsed_value = self._value_to_type(value)
+            parsed_value = self._cached_value_to_type(value)
 
             if parsed_value is None:
                 if not self._required:
@@ -111,6 +151,50 @@ class ConfigEntry:
             LOGGER.exception(ex)
             self._raise_invalid_value(value, ex)
 
+    def _cached_value_to_type(self, value: Any) -> Any:
+        """
+        Converts the given value to the expected value type of this entry,
+        using the parse cache of this entry type (if any)
+        :param value: the yaml value
+        :return: parsed value
+        """
+        cache = self.parse_cache
+        if cache is None:
+            return self._value_to_type(value)
+
+        # 1, 1.0 and True are equal, but might not be parsed the same way
+        key = (self.__class__, self._parse_parameters(), type(value), value)
+        try:
+            hash(key)
+        except TypeError:
+            return self._value_to_type(value)
+
+        parsed_value = cache.get(key)
+        if parsed_value is NOT_CACHED:
+            parsed_value = self._value_to_type(value)
+            cache.put(key, parsed_value)
+        return self._copy_parsed_value(parsed_value)
+
+    def _parse_parameters(self) -> Hashable:
+        """
+        :return: parameters of this entry affecting the result of _value_to_type()
+        """
+        return ()
+
+    def _describe_parse_parameters(self) -> Any:
+        """
+        :return: parameters of this entry affecting the result of _value_to_type(),
+                 whose repr() is the same in every process (used to fingerprint config schemas)
+        """
+        return self._parse_parameters()
+
+    def _copy_parsed_value(self, value: Any) -> Any:
+        """
+        :param value: a cached value
+        :return: the value to hand out, cached values that are mutable have to be copied
+        """
+        return value
+
     def _value_to_type(self, value: Any) -> Any:
         """
         Converts the given value to the expected value type of this entry
@@ -136,3 +220,68 @@ class ConfigEntry:
         if reason is not None:
             message += ": {}".format(reason)
         raise ValueError(message)
+
+
+class EntrySpec(NamedTuple):
+    """
+    Precomputed metadata of a config entry declared on a config class
+    """
+    # position of the entry within the config class
+    index: int
+    # name of the class attribute holding the entry
+    attribute_name: str
+    # human readable name of the entry
+    name: str
+    key_path: Tuple[str, ...]
+    # casefolded key path used for case insensitive lookups
+    key_path_casefold: Tuple[str, ...]
+    env_key: str
+    # candidate environment variable names, in order of precedence (using the default naming of EnvSource)
+    env_keys: Tuple[str, ...]
+    entry: ConfigEntry
+
+
+class BoundConfigEntry:
+    """
+    Binds a (shared) config entry declaration to the value store of a config instance.
+    Attributes other than the value are taken from the declaration.
+    Used as entries of non-singleton config instances, singletons use the declarations themselves.
+    """
+    __slots__ = ("_entry", "_config", "_index")
+
+    def __init__(self, entry: ConfigEntry, config, index: int):
+        """
+        :param entry: the config entry declaration
+        :param config: the config instance holding the value
+        :param index: position of the value in the value store of the config instance
+        """
+        self._entry = entry
+        self._config = config
+        self._index = index
+
+    @property
+    def value(self) -> Any:
+        """
+        :return: the value of this config entry
+        """
+        return self._config._snapshot[self]
+
+    @value.setter
+    def value(self, new_value) -> None:
+        """
+        :param new_value: the new value to set
+        """
+        self._config._set_value(self._index, new_value)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._entry, name)
+
+
+class ConfigChange(NamedTuple):
+    """
+    Describes the change of an entry value caused by reloading the configuration
+    """
+    # the entry declaration for singletons, a BoundConfigEntry otherwise
+    entry: Union[ConfigEntry, BoundConfigEntry]
+    old_value: Any
+    new_value: Any
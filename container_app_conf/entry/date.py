@@ -19,30 +19,76 @@
 #  SOFTWARE.
 
 
-from datetime import datetime
-from typing import Optional, Any
-
-import dateutil.parser
+from datetime import datetime, date
+from typing import Optional, Any, List, Hashable
 
 from container_app_conf import ConfigEntry
+from container_app_conf.entry.parse_cache import ParseCache
 
 
 class DateConfigEntry(ConfigEntry):
     _example = "2008-09-03T20:56:35.450686Z"
+    parse_cache = ParseCache()
+
+    def __init__(self, key_path: List[str], example: Any = None, description: Optional[str] = None, default: Any = None,
+                 required: bool = None, secret: bool = None, formats: List[str] = None,
+                 dateutil_fallback: bool = False):
+        """
+        :param formats: strptime formats to try (in order) for values that are not ISO 8601 formatted
+        :param dateutil_fallback: whether to parse values in any other format using the (slow)
+                                  fuzzy parser of python-dateutil
+        """
+        self.formats = tuple(formats) if formats is not None else ()
+        self.dateutil_fallback = dateutil_fallback
+        super().__init__(key_path, example, description, default, required, secret)
+
+    def _parse_parameters(self) -> Hashable:
+        return self.formats, self.dateutil_fallback
+
+    def _cached_value_to_type(self, value: Any) -> Optional[datetime]:
+        try:
+            return super()._cached_value_to_type(value)
+        except ValueError:
+            if not self.dateutil_fallback or not isinstance(value, str):
+                raise
+
+        # results of the fuzzy parser depend on the current date (f.ex. "20:56"), so they are never cached
+        import dateutil.parser
+        return dateutil.parser.parse(value)
 
     def _value_to_type(self, value: Any) -> Optional[datetime]:
         """
         Tries to permissively convert the given value to a datetime.
+        Values in other formats are parsed by the dateutil fallback (if enabled), see _cached_value_to_type().
         :param value: the value to parse
         :return: the parsed date value
         """
         if isinstance(value, datetime):
             return value
-        elif isinstance(value, str):
-            return dateutil.parser.parse(value)
-        else:
+        elif isinstance(value, date):
+            return datetime(value.year, value.month, value.day)
+        elif not isinstance(value, str):
             raise ValueError("Unsupported type: {}".format(type(value)))
 
+        text = value.strip()
+        iso_text = text
+        if iso_text.endswith(("Z", "z")):
+            # older python versions don't accept a "Z" suffix
+            iso_text = iso_text[:-1] + "+00:00"
+        try:
+            return datetime.fromisoformat(iso_text)
+        except ValueError:
+            pass
+
+        for date_format in self.formats:
+            try:
+                # compiled formats are cached by strptime
+                return datetime.strptime(text, date_format)
+            except ValueError:
+                continue
+
+        raise ValueError("Unsupported date format: {}".format(value))
+
     def _type_to_value(self, type: Any) -> Any:
         if type is None:
             return None
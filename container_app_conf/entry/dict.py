@@ -18,21 +18,35 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 import ast
+import copy
 import json
-from typing import List, Optional, Any
-
-from voluptuous import Schema
+from typing import List, Optional, Any, Hashable, TYPE_CHECKING
 
 from container_app_conf import ConfigEntry
+from container_app_conf.entry.parse_cache import ParseCache
+
+if TYPE_CHECKING:
+    from voluptuous import Schema
 
 
 class DictConfigEntry(ConfigEntry):
+    parse_cache = ParseCache()
 
     def __init__(self, key_path: List[str], example: Any = None, description: Optional[str] = None, default: Any = None,
-                 required: bool = None, secret: bool = None, schema: Schema = None):
+                 required: bool = None, secret: bool = None, schema: 'Schema' = None):
         self.schema = schema
         super().__init__(key_path, example, description, default, required, secret)
 
+    def _parse_parameters(self) -> Hashable:
+        # schemas are not hashable
+        return () if self.schema is None else (self,)
+
+    def _describe_parse_parameters(self) -> Any:
+        return None if self.schema is None else self.schema.schema
+
+    def _copy_parsed_value(self, value: Any) -> Any:
+        return copy.deepcopy(value)
+
     def _value_to_type(self, value: Any) -> Any:
         if isinstance(value, str):
             try:
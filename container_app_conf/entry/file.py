@@ -19,7 +19,7 @@
 #  SOFTWARE.
 import os
 import pathlib
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Hashable
 
 from container_app_conf import ConfigEntry
 
@@ -36,6 +36,9 @@ class FileConfigEntry(ConfigEntry):
         self.check_existence = check_existence
         super().__init__(key_path, example, description, default, required, secret)
 
+    def _parse_parameters(self) -> Hashable:
+        return self.check_existence
+
     def _value_to_type(self, value: Any) -> Optional[pathlib.Path]:
         """
         Tries to permissively convert the given value to a file path.
@@ -72,6 +75,9 @@ class DirectoryConfigEntry(ConfigEntry):
         self.check_existence = check_existence
         super().__init__(key_path, example, description, default, required, secret)
 
+    def _parse_parameters(self) -> Hashable:
+        return self.check_existence
+
     def _value_to_type(self, value: Any) -> Optional[pathlib.Path]:
         """
         Tries to permissively convert the given value to a folder path.
@@ -17,21 +17,27 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
-from typing import List, Any, Optional
-
-from py_range_parse import Range
+from typing import List, Any, Optional, Hashable, TYPE_CHECKING
 
 from container_app_conf import ConfigEntry
 
+if TYPE_CHECKING:
+    from py_range_parse import Range
+
 
 class FloatConfigEntry(ConfigEntry):
     _example = "3.1415926535"
 
     def __init__(self, key_path: List[str], example: Any = None, description: Optional[str] = None, default: Any = None,
-                 required: bool = None, secret: bool = None, range: Range = None):
+                 required: bool = None, secret: bool = None, range: 'Range' = None):
         self.range = range
         super().__init__(key_path, example, description, default, required, secret)
 
+    def _parse_parameters(self) -> Hashable:
+        if self.range is None:
+            return None
+        return self.range.start, self.range.end, self.range.start_inclusive, self.range.end_inclusive
+
     def _value_to_type(self, value: Any) -> Optional[float]:
         """
         Tries to permissively convert the given value to a float.
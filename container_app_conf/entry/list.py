@@ -17,7 +17,7 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
-from typing import Type, List, Any, Optional
+from typing import Type, List, Any, Optional, Hashable
 
 from container_app_conf import ConfigEntry
 
@@ -63,6 +63,14 @@ class ListConfigEntry(ConfigEntry):
             secret=secret
         )
 
+    def _parse_parameters(self) -> Hashable:
+        item_entry = self._item_entry
+        return item_entry.__class__, item_entry._parse_parameters(), item_entry._required, self.delimiter
+
+    def _describe_parse_parameters(self) -> Any:
+        item_entry = self._item_entry
+        return item_entry.__class__, item_entry._describe_parse_parameters(), item_entry._required, self.delimiter
+
     @property
     def example(self) -> Any:
         if self.default is not None:
@@ -83,7 +91,7 @@ class ListConfigEntry(ConfigEntry):
         if not isinstance(value, List):
             value = str(value).split(self.delimiter)
 
-        return list(map(lambda x: self._item_entry._value_to_type(x), filter(lambda x: x, value)))
+        return list(map(lambda x: self._item_entry._cached_value_to_type(x), filter(lambda x: x, value)))
 
     def _type_to_value(self, type: List | str) -> Any:
         if type is None:
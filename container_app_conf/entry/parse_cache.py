@@ -0,0 +1,91 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+# returned by ParseCache.get() if there is no cached value
+NOT_CACHED = object()
+
+
+class ParseCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    # number of currently cached values
+    size: int
+    max_size: int
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parsed values, used by entry types with expensive parsing
+    to avoid parsing the same raw value over and over again (f.ex. on every reload).
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        :param max_size: maximum number of cached values, the least recently used value is dropped first
+        """
+        self.max_size = max_size
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        :param key: cache key
+        :return: the cached value, or NOT_CACHED
+        """
+        with self._lock:
+            value = self._values.get(key, NOT_CACHED)
+            if value is NOT_CACHED:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._values.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        :param key: cache key
+        :param value: the parsed value
+        """
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def stats(self) -> ParseCacheStats:
+        """
+        :return: hit/miss statistics of this cache
+        """
+        with self._lock:
+            return ParseCacheStats(self._hits, self._misses, len(self._values), self.max_size)
+
+    def clear(self):
+        """
+        Drops all cached values and resets statistics
+        """
+        with self._lock:
+            self._values.clear()
+            self._hits = 0
+            self._misses = 0
@@ -17,22 +17,25 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
-from typing import Optional, Any
-
-from py_range_parse import Range, parse_range
+from typing import Optional, Any, TYPE_CHECKING
 
 from container_app_conf import ConfigEntry
 
+if TYPE_CHECKING:
+    from py_range_parse import Range
+
 
 class RangeConfigEntry(ConfigEntry):
     _example = "[-5..5]"
 
-    def _value_to_type(self, value: Any) -> Optional[Range]:
+    def _value_to_type(self, value: Any) -> Optional['Range']:
         """
         Tries to convert the given value to a range.
         :param value: the value to parse
         :return: the parsed range value
         """
+        from py_range_parse import Range, parse_range
+
         if isinstance(value, Range):
             return value
         elif isinstance(value, str):
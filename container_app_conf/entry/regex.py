@@ -19,16 +19,15 @@
 #  SOFTWARE.
 
 import re
-from typing import Pattern, List, Any, Optional
+from typing import Pattern, List, Any, Optional, Hashable
 
 from container_app_conf import ConfigEntry
-from container_app_conf.util import regex_deepcopy_36_workaround
-
-regex_deepcopy_36_workaround()
+from container_app_conf.entry.parse_cache import ParseCache
 
 
 class RegexConfigEntry(ConfigEntry):
     _example = r"^[a-zA-z0-9]*$"
+    parse_cache = ParseCache()
 
     def __init__(self, key_path: List[str], example: Any = None, description: Optional[str] = None, default: Any = None,
                  required: bool = None, secret: bool = None, flags: Optional[int] = None):
@@ -38,6 +37,9 @@ class RegexConfigEntry(ConfigEntry):
         self.flags = flags | re.UNICODE if flags is not None else None
         super().__init__(key_path, example, description, default, required, secret)
 
+    def _parse_parameters(self) -> Hashable:
+        return self.flags
+
     def _value_to_type(self, value: Any) -> Optional[Pattern]:
         if value is None and self._required:
             return None
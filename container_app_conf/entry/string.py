@@ -19,12 +19,9 @@
 #  SOFTWARE.
 import re
 from re import Pattern
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Hashable
 
 from container_app_conf import ConfigEntry
-from container_app_conf.util import regex_deepcopy_36_workaround
-
-regex_deepcopy_36_workaround()
 
 
 class StringConfigEntry(ConfigEntry):
@@ -35,6 +32,9 @@ class StringConfigEntry(ConfigEntry):
         self.regex = re.compile(regex) if regex is not None else None
         super().__init__(key_path, example, description, default, required, secret)
 
+    def _parse_parameters(self) -> Hashable:
+        return self.regex
+
     def _value_to_type(self, value: Any) -> Optional[str]:
         """
         Converts the given type to the expected type
@@ -17,29 +17,109 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
+import re
 from datetime import timedelta
 from typing import Optional, Any
 
-from pytimeparse import parse
-
 from container_app_conf import ConfigEntry
+from container_app_conf.entry.parse_cache import ParseCache
+
+_NUMBER = r"\d+(?:\.\d+)?|\.\d+"
+# unit group name -> unit spellings, longest first
+_DATE_UNITS = [
+    ("weeks", r"weeks|week|wks|wk|w"),
+    ("days", r"days|day|dys|dy|d"),
+]
+_TIME_UNITS = [
+    ("hours", r"hours|hour|hrs|hr|h"),
+    ("minutes", r"minutes|minute|mins|min|m"),
+    ("seconds", r"seconds|second|secs|sec|s"),
+    ("milliseconds", r"milliseconds|millisecond|millis|msecs|msec|ms"),
+]
+
+
+def _unit_groups(units: list) -> str:
+    """
+    :param units: list of (unit group name, unit spellings) tuples
+    :return: pattern matching a sequence of optional numbers with units, in the given order
+    """
+    return "".join(map(
+        lambda x: r"(?:(?P<{0}>{1})\s*(?:{2})(?![a-z])\s*[,/]?\s*(?:and\s+)?)?".format(x[0], _NUMBER, x[1]),
+        units))
+
+
+# a single grammar for all supported formats:
+# bare numbers (seconds), unit notation (f.ex. "1h 30m", "4h3s", "250ms"),
+# clock notation ([[days:]hours:]minutes:seconds, optionally preceded by weeks and days, f.ex. "2 days, 4:13:02")
+# and ISO 8601 durations (f.ex. "PT1H30M", "P1DT2H", "P2W")
+DURATION_REGEX = re.compile(
+    r"(?P<sign>[+-])?\s*(?:"
+    r"(?P<number_seconds>{number})"
+    r"|{date_units}(?:"
+    r"(?:(?:(?:(?P<clock_days>\d+)[:-])?(?P<clock_hours>\d+):)?(?P<clock_minutes>\d+))?:(?P<clock_seconds>{number})"
+    r"|{time_units})"
+    r"|P(?:(?P<iso_weeks>{number})W)?(?:(?P<iso_days>{number})D)?"
+    r"(?:T(?:(?P<iso_hours>{number})H)?(?:(?P<iso_minutes>{number})M)?(?:(?P<iso_seconds>{number})S)?)?"
+    r")".format(number=_NUMBER, date_units=_unit_groups(_DATE_UNITS), time_units=_unit_groups(_TIME_UNITS)),
+    re.IGNORECASE | re.ASCII
+)
+
+_UNIT_SECONDS = {
+    "weeks": 7 * 24 * 60 * 60,
+    "days": 24 * 60 * 60,
+    "hours": 60 * 60,
+    "minutes": 60,
+    "seconds": 1,
+    "milliseconds": 0.001,
+}
+# length of a unit in seconds for every group of DURATION_REGEX (None for the sign)
+_GROUP_SECONDS = tuple(map(
+    lambda x: None if x == "sign" else _UNIT_SECONDS[x.split("_")[-1]],
+    sorted(DURATION_REGEX.groupindex.keys(), key=lambda x: DURATION_REGEX.groupindex[x])))
+
+
+def parse_duration(value: str) -> Optional[timedelta]:
+    """
+    Parses a duration
+    :param value: the duration, f.ex. "90", "1:30", "2 days, 4:13:02", "1h 30m", "250ms" or "PT1H30M"
+    :return: the parsed duration, or None if the given value is not a valid duration
+    """
+    match = DURATION_REGEX.fullmatch(value.strip())
+    if match is None:
+        return None
+
+    seconds = None
+    for number, unit_seconds in zip(match.groups(), _GROUP_SECONDS):
+        if number is None or unit_seconds is None:
+            continue
+        seconds = (seconds or 0) + (float(number) if "." in number else int(number)) * unit_seconds
+
+    if seconds is None:
+        # nothing but whitespace and separators
+        return None
+
+    return timedelta(seconds=-seconds if match.group("sign") == "-" else seconds)
 
 
 class TimeDeltaConfigEntry(ConfigEntry):
     _example = "4h32m1s"
+    parse_cache = ParseCache()
 
     def _value_to_type(self, value: Any) -> Optional[timedelta]:
         """
         Tries to permissively convert the given value to a timedelta.
+        Numbers are interpreted as seconds.
         :param value: the value to parse
         :return: the parsed date value
         """
         if isinstance(value, timedelta):
             return value
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            return timedelta(seconds=value)
         elif isinstance(value, str):
-            parsed = parse(value)
+            parsed = parse_duration(value)
             if parsed is None:
                 raise ValueError("Cannot parse the given timedelta format: {}".format(value))
-            return timedelta(seconds=parsed)
+            return parsed
         else:
             raise ValueError("Unsupported type: {}".format(type(value)))
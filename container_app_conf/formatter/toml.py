@@ -19,8 +19,6 @@
 #  SOFTWARE.
 import io
 
-import toml
-
 from container_app_conf import ConfigFormatter
 
 
@@ -30,6 +28,8 @@ class TomlFormatter(ConfigFormatter):
     """
 
     def format(self, data: dict) -> str:
+        import toml
+
         output = io.StringIO()
         toml.dump(data, output)
         output.seek(0)
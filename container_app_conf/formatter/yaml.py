@@ -19,18 +19,42 @@
 #  SOFTWARE.
 import io
 
-from ruamel.yaml import YAML
-
 from container_app_conf import ConfigFormatter
 
 
-class YamlFormatter(ConfigFormatter):
+def create_yaml(typ: str = 'rt', pure: bool = False):
     """
-    Formats config entries like a YAML config file
+    Creates a YAML instance, ruamel.yaml is only imported when this is called
+    :param typ: the ruamel.yaml loader/dumper type
+    :param pure: whether to use the pure python implementation
+    :return: the YAML instance
     """
-    yaml = YAML()
+    from ruamel.yaml import YAML
+    yaml = YAML(typ=typ, pure=pure)
     yaml.default_style = False
     yaml.default_flow_style = False
+    return yaml
+
+
+class LazyYaml:
+    """
+    Class attribute holding a YAML instance that is only created on first access
+    """
+
+    def __init__(self):
+        self._yaml = None
+
+    def __get__(self, instance, owner):
+        if self._yaml is None:
+            self._yaml = create_yaml()
+        return self._yaml
+
+
+class YamlFormatter(ConfigFormatter):
+    """
+    Formats config entries like a YAML config file
+    """
+    yaml = LazyYaml()
 
     def format(self, data: dict) -> str:
         output = io.StringIO()
@@ -0,0 +1,190 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import struct
+from pathlib import Path
+from typing import List, Any, Tuple, Optional
+
+from container_app_conf.cache import SnapshotCache
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SharedSnapshot:
+    """
+    Shares the resolved values of a config object with other processes (f.ex. the workers of a prefork server),
+    so they don't have to load any data source or parse any value themselves.
+
+    The publishing process writes the values to a data file per generation and then increases the
+    generation counter in a small control file. Other processes memory map the control file,
+    so checking for a new generation is a single memory read.
+
+    Note: Data files are unpickled when read, only use locations that are not writable by untrusted users.
+    """
+    MAGIC = b"CACSNAP1"
+    # magic, generation
+    CONTROL_HEADER = struct.Struct("<8sQ")
+    GENERATION = struct.Struct("<Q")
+    GENERATION_OFFSET = 8
+    # magic, generation, schema digest, payload length
+    DATA_HEADER = struct.Struct("<8sQ32sQ")
+    # number of outdated data files kept for processes that might still be reading them
+    KEEP_GENERATIONS = 1
+
+    def __init__(self, path: str | Path):
+        """
+        :param path: path of the control file, data files are stored next to it
+        """
+        self.path = Path(path).expanduser()
+        self._control = None
+        self._control_writable = False
+
+    def _data_path(self, generation: int) -> Path:
+        """
+        :param generation: snapshot generation
+        :return: path of the data file of the given generation
+        """
+        return self.path.with_name("{}.{}".format(self.path.name, generation))
+
+    def _map_control(self, writable: bool) -> Optional[mmap.mmap]:
+        """
+        :param writable: whether the control file is written to (creating it if necessary)
+        :return: memory map of the control file, None if it doesn't exist (yet)
+        """
+        if self._control is not None and (not writable or self._control_writable):
+            return self._control
+
+        if writable:
+            os.makedirs(self.path.parent, exist_ok=True)
+            if not self.path.is_file():
+                # never replace an existing control file, other processes might have mapped it
+                with open(self.path, 'ab') as file:
+                    if file.tell() == 0:
+                        file.write(self.CONTROL_HEADER.pack(self.MAGIC, 0))
+        elif not self.path.is_file():
+            return None
+
+        with open(self.path, 'r+b' if writable else 'rb') as file:
+            control = mmap.mmap(file.fileno(), self.CONTROL_HEADER.size,
+                                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        magic, _ = self.CONTROL_HEADER.unpack_from(control)
+        if magic != self.MAGIC:
+            control.close()
+            raise ValueError("Not a shared config snapshot: {}".format(self.path))
+
+        if self._control is not None:
+            self._control.close()
+        self._control = control
+        self._control_writable = writable
+        return control
+
+    @property
+    def generation(self) -> int:
+        """
+        :return: the generation of the latest published snapshot, 0 if none has been published yet
+        """
+        control = self._map_control(writable=False)
+        if control is None:
+            return 0
+        return self.GENERATION.unpack_from(control, self.GENERATION_OFFSET)[0]
+
+    @staticmethod
+    def _schema_digest(config) -> bytes:
+        """
+        :param config: the config object
+        :return: digest of the schema of the given config
+        """
+        # values are published by another process, which might not have the same default values
+        return hashlib.sha256(SnapshotCache._schema_fingerprint(config, include_defaults=False).encode()).digest()
+
+    def publish(self, config) -> int:
+        """
+        Publishes the current values of the given config object
+        :param config: the config object
+        :return: the generation of the published snapshot
+        """
+        payload = pickle.dumps(config.snapshot().copy_values(), protocol=pickle.HIGHEST_PROTOCOL)
+
+        control = self._map_control(writable=True)
+        generation = self.GENERATION.unpack_from(control, self.GENERATION_OFFSET)[0] + 1
+
+        data_path = self._data_path(generation)
+        tmp_path = data_path.with_name("{}.{}.tmp".format(data_path.name, os.getpid()))
+        with open(tmp_path, 'wb') as file:
+            file.write(self.DATA_HEADER.pack(self.MAGIC, generation, self._schema_digest(config), len(payload)))
+            file.write(payload)
+        os.replace(tmp_path, data_path)
+
+        # make the new generation visible only once its data is complete
+        self.GENERATION.pack_into(control, self.GENERATION_OFFSET, generation)
+        control.flush()
+
+        outdated = self._data_path(generation - 1 - self.KEEP_GENERATIONS)
+        try:
+            os.remove(outdated)
+        except FileNotFoundError:
+            pass
+
+        return generation
+
+    def load(self, config) -> Tuple[int, List[Any]]:
+        """
+        Reads the values of the latest published snapshot
+        :param config: the config object the values are read for
+        :return: generation and values of the snapshot
+        :raises ValueError if no snapshot has been published yet or it belongs to a different config schema
+        """
+        while True:
+            generation = self.generation
+            if generation <= 0:
+                raise ValueError("No config snapshot has been published to {} yet".format(self.path))
+
+            try:
+                with open(self._data_path(generation), 'rb') as file, \
+                        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    magic, data_generation, schema_digest, length = self.DATA_HEADER.unpack_from(data)
+                    if magic != self.MAGIC or data_generation != generation:
+                        raise ValueError("Invalid shared config snapshot: {}".format(self._data_path(generation)))
+                    if schema_digest != self._schema_digest(config):
+                        raise ValueError("Shared config snapshot {} was published for a different config schema"
+                                         .format(self.path))
+
+                    offset = self.DATA_HEADER.size
+                    values = pickle.loads(data[offset:offset + length])
+            except FileNotFoundError:
+                if self.generation == generation:
+                    raise
+                # the snapshot has been replaced by a newer one in the meantime
+                LOGGER.debug("Shared config snapshot generation {} is gone, retrying".format(generation))
+                continue
+
+            return generation, values
+
+    def close(self):
+        """
+        Unmaps the control file
+        """
+        if self._control is not None:
+            self._control.close()
+            self._control = None
@@ -0,0 +1,70 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+from typing import List, Any, Dict
+
+from container_app_conf.entry import UnparsedValue, BoundConfigEntry, ConfigEntry
+
+
+class ConfigSnapshot:
+    """
+    Immutable set of entry values of a config object.
+    A reload builds a new snapshot and publishes it with a single reference assignment,
+    so readers never block and never see values of different generations.
+    """
+    __slots__ = ("_values", "_indices", "generation")
+
+    def __init__(self, values: List[Any], indices: Dict[ConfigEntry, int], generation: int = 0):
+        """
+        :param values: entry values, indexed by entry index. Must not be modified after publishing,
+                       except for memoizing lazily parsed values.
+        :param indices: map of (entry declaration -> entry index) of the config class
+        :param generation: increases with every published snapshot
+        """
+        self._values = values
+        self._indices = indices
+        self.generation = generation
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, entry) -> Any:
+        """
+        :param entry: a config entry (or entry declaration) of the config object this snapshot belongs to
+        :return: the value of the given entry
+        :raises KeyError if the given entry is not declared by the config class of this snapshot
+        """
+        declaration = entry._entry if type(entry) is BoundConfigEntry else entry
+        index = self._indices.get(declaration, None)
+        if index is None:
+            raise KeyError("Config entry {} is not part of this config".format(">".join(declaration.key_path)))
+
+        value = self._values[index]
+        if type(value) is UnparsedValue:
+            # lazy mode, parsing the same raw value always yields the same result
+            # so it is safe to memoize it without locking
+            value = declaration._parse_value(value.raw)
+            self._values[index] = value
+        return value
+
+    def copy_values(self) -> List[Any]:
+        """
+        :return: a mutable copy of all values, used to build the next snapshot
+        """
+        return list(self._values)
@@ -17,54 +17,80 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
+import hashlib
 import logging
-from collections import OrderedDict
-from typing import List, Optional, Any, Dict
+import os
+import time
+import weakref
+from typing import List, Optional, Any, Dict, Tuple, Iterable, NamedTuple
 
-from container_app_conf import ConfigEntry
+from container_app_conf.entry import ConfigEntry, EntrySpec
 
 LOGGER = logging.getLogger(__name__)
 
+# sentinel returned by DataSource.lookup() if a source holds no value for an entry
+MISSING = object()
+# marks keys that exist multiple times when ignoring case
+_DUPLICATE = object()
+
 
 class DataSource:
+    # whether has() or get() is overridden, values are looked up through them in this case
+    _custom_accessors: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._custom_accessors = cls.has is not DataSource.has or cls.get is not DataSource.get
 
     def __init__(self, ignore_case_in_keys: bool = False):
         """
         Constructor
         :param ignore_case_in_keys: whether to ignore case in keys
         """
-        self.root = {}
         self.ignore_case_in_keys = ignore_case_in_keys
+        self._set_root({})
 
     def load(self):
         """
         Loads all values of this data source into memory
         """
-        self.root = self._load()
+        self._set_root(self._load())
 
-        if self.ignore_case_in_keys:
-            self.root = self._convert_keys_to_lower(self.root)
+    def _set_root(self, root: Dict):
+        """
+        Replaces the value tree of this source
+        :param root: value tree
+        """
+        self.root = root
+        # (casefolded) key path of a node -> map of (casefolded key -> value) of its children,
+        # only built for nodes that are actually looked up
+        self._casefold_nodes = {}
+        # case insensitive lookups walk the tree instead
+        self._index = {} if self.ignore_case_in_keys else self._build_index(root)
 
-    def _convert_keys_to_lower(self, dictionary: dict) -> Dict:
+    def _build_index(self, root: Dict) -> Dict[Tuple[str, ...], Any]:
         """
-        Recursively converts all dictionary keys to lowercase.
-        This is used for case insensitive key search.
-        :param dictionary: the dictionary to convert
-        :return: converted dict
-        :raises ValueError when a duplicate key is detected
+        Flattens the given value tree so values can be looked up by their full key path.
+        Inner nodes are indexed as well, since they can be values of their own (f.ex. dictionaries).
+        :param root: value tree
+        :return: map of (key path -> value)
         """
-        lower_case_dictionary = OrderedDict()
+        index = {}
+        if root is None:
+            return index
 
-        for key, value in dictionary.items():
-            if not key.islower():
-                if key.lower() in lower_case_dictionary.keys():
-                    raise ValueError(f"Duplicate (case insensitive) key found: {key.lower()}")
-            if isinstance(value, dict):
-                lower_case_dictionary[key.lower()] = self._convert_keys_to_lower(value)
-            else:
-                lower_case_dictionary[key.lower()] = value
+        nodes = [((), root)]
+        while len(nodes) > 0:
+            path, node = nodes.pop()
+            for key, value in node.items():
+                if value is None:
+                    continue
+                key_path = path + (key,)
+                index[key_path] = value
+                if isinstance(value, dict):
+                    nodes.append((key_path, value))
 
-        return lower_case_dictionary
+        return index
 
     def _load(self) -> Dict:
         """
@@ -73,24 +99,129 @@ class DataSource:
         """
         raise NotImplementedError()
 
+    def fingerprint(self, entries: Iterable[EntrySpec]) -> Optional[str]:
+        """
+        Computes a fingerprint of the values this source would provide for the given entries, without loading it.
+        :param entries: the entries of interest
+        :return: a fingerprint that changes whenever the values of this source might have changed,
+                 or None if this source does not support fingerprinting
+        """
+        return None
+
+    def prune(self, entries: Iterable[EntrySpec]):
+        """
+        Drops all loaded values that don't belong to the given entries
+        :param entries: the entries whose values should be kept
+        """
+        root = {}
+        kept = set()
+        # parents first, values of children are contained in the value of their parent already
+        for entry in sorted(entries, key=lambda x: len(x.key_path)):
+            key_path = tuple(entry.key_path)
+            if any(map(lambda x: key_path[:x] in kept, range(1, len(key_path)))):
+                continue
+
+            value = self.lookup(entry)
+            if value is MISSING:
+                continue
+
+            kept.add(key_path)
+            node = root
+            for key in key_path[:-1]:
+                node = node.setdefault(key, {})
+            node[key_path[-1]] = value
+
+        self._set_root(root)
+
+    def release(self):
+        """
+        Drops all loaded values, the source has to be loaded again before it can be used
+        """
+        self._set_root({})
+
+    def has_changed(self) -> bool:
+        """
+        Cheaply checks whether the values of this source might have changed since it was last loaded.
+        Unchanged sources are not loaded again when the configuration is reloaded.
+        :return: False if the source is known to be unchanged, True otherwise
+        """
+        return True
+
+    def lookup(self, entry: ConfigEntry | EntrySpec) -> Any:
+        """
+        Retrieves the value of the given config entry
+        :param entry: the config entry (or its precomputed metadata)
+        :return: the value, or MISSING if the source doesn't contain a value for the given entry
+        """
+        if self._custom_accessors:
+            if isinstance(entry, EntrySpec):
+                entry = entry.entry
+            if not self.has(entry):
+                return MISSING
+            return self.get(entry)
+
+        return self._lookup(entry)
+
+    def _lookup(self, entry: ConfigEntry | EntrySpec) -> Any:
+        """
+        Retrieves the value of the given config entry, override this to customize lookups
+        :param entry: the config entry (or its precomputed metadata)
+        :return: the value, or MISSING if the source doesn't contain a value for the given entry
+        """
+        if self.ignore_case_in_keys:
+            return self._casefold_lookup(self._index_key(entry))
+        return self._index.get(self._index_key(entry), MISSING)
+
+    def _casefold_lookup(self, key_path: Tuple[str, ...]) -> Any:
+        """
+        Retrieves a value ignoring the case of keys.
+        The children of every node along the path are indexed by their casefolded key once per load,
+        duplicate (case insensitive) keys are only detected along the given path.
+        :param key_path: casefolded key path
+        :return: the value, or MISSING if the source doesn't contain a value for the given key path
+        :raises ValueError when a duplicate key is detected
+        """
+        node = self.root
+        for depth, key in enumerate(key_path):
+            if not isinstance(node, dict):
+                return MISSING
+
+            node_path = key_path[:depth]
+            children = self._casefold_nodes.get(node_path, None)
+            if children is None:
+                children = {}
+                for child_key, child_value in node.items():
+                    casefolded_key = child_key.casefold() if isinstance(child_key, str) else child_key
+                    children[casefolded_key] = _DUPLICATE if casefolded_key in children else child_value
+                self._casefold_nodes[node_path] = children
+
+            node = children.get(key, None)
+            if node is None:
+                return MISSING
+            if node is _DUPLICATE:
+                raise ValueError(f"Duplicate (case insensitive) key found: {key}")
+
+        return node
+
+    def _index_key(self, entry: ConfigEntry | EntrySpec) -> Tuple[str, ...]:
+        """
+        :param entry: the config entry (or its precomputed metadata)
+        :return: the key of the given entry in the index of this source
+        """
+        if isinstance(entry, EntrySpec):
+            return entry.key_path_casefold if self.ignore_case_in_keys else entry.key_path
+
+        if self.ignore_case_in_keys:
+            return tuple(map(lambda x: x.casefold(), entry.key_path))
+        return tuple(entry.key_path)
+
     def has(self, entry: ConfigEntry) -> bool:
         """
         Checks whether the data source has a value for the given config entry
         :param entry: the config entry to check
         :return: True if the source contains a value for the given entry, False otherwise
         """
-        value = self.root
-        if value is None:
-            return False
-
-        for key in entry.key_path:
-            if self.ignore_case_in_keys:
-                key = key.lower()
-            value = value.get(key)
-            if value is None:
-                return False
-
-        return True
+        return self._lookup(entry) is not MISSING
 
     def get(self, entry: ConfigEntry) -> Any:
         """
@@ -98,33 +229,49 @@ class DataSource:
         :param entry: config entry
         :return: value
         """
-        value = self.root
-        if value is None:
-            return None
+        value = self._lookup(entry)
+        if value is MISSING:
+            return entry.value
+        return value
 
-        for key in entry.key_path:
-            if self.ignore_case_in_keys:
-                key = key.lower()
-            value = value.get(key)
-            if value is None:
-                return entry.value
 
-        return value
+class FileDiscovery(NamedTuple):
+    """
+    Result of searching for a config file
+    """
+    # file names searched for, in order of precedence
+    candidates: Tuple[str, ...]
+    # (directory, modification time) of all directories that have been scanned
+    directories: Tuple[Tuple[str, Optional[int]], ...]
+    # whether the result may be reused as long as no scanned directory has been modified
+    reusable: bool
+    file_path: Optional[str]
+    # point in time (seconds since the epoch) the search was done
+    time: float
 
 
 class FilesystemSource(DataSource):
     DEFAULT_FILE_EXTENSIONS = []
+    # directories modified within this time frame (in nanoseconds) are always scanned again,
+    # since further modifications might not change their modification time (depending on its resolution)
+    RACY_MODIFICATION_WINDOW = 2_000_000_000
 
     def __init__(self, file_name: str | List[str],
                  path: str | List[str] = None,
                  file_extension: str | List[str] = None,
-                 ignore_case_in_keys: bool = False):
+                 ignore_case_in_keys: bool = False,
+                 shared: bool = False):
         """
         :param path: allowed config file path(s)
         :param file_name: allowed config file name(s)
         :param file_extension: allowed config file extension(s)
         :param ignore_case_in_keys: whether to ignore case in keys
+        :param shared: whether to share the parsed file content with all other shared data sources
+                       of this process reading the same file (see SharedSourceCache)
         """
+        self.shared = shared
+        # releases the reference to the shared file content currently in use
+        self._shared_reference = None
         super().__init__(ignore_case_in_keys)
         if path is None:
             from container_app_conf import DEFAULT_CONFIG_FILE_PATHS
@@ -136,14 +283,109 @@ class FilesystemSource(DataSource):
             self.file_extensions = self.DEFAULT_FILE_EXTENSIONS
         else:
             self.file_extensions = file_extension if isinstance(file_extension, list) else [file_extension]
+        self._discovery = None
+
+    @property
+    def file_path(self) -> Optional[str]:
+        """
+        :return: path of the config file found by the last search, None if none was found (or there was no search yet)
+        """
+        discovery = self._discovery
+        return None if discovery is None else discovery.file_path
+
+    @property
+    def discovery_time(self) -> Optional[float]:
+        """
+        :return: point in time (seconds since the epoch) of the last search for a config file, None if there was none
+        """
+        discovery = self._discovery
+        return None if discovery is None else discovery.time
+
+    def fingerprint(self, entries: Iterable[EntrySpec]) -> Optional[str]:
+        file_path = self._find_config_file()
+        if file_path is None:
+            return "-"
+
+        stat = os.stat(file_path)
+        with open(file_path, 'rb') as file:
+            content_hash = hashlib.sha256(file.read()).hexdigest()
+        return "{}:{}:{}:{}:{}".format(file_path, stat.st_ino, stat.st_size, stat.st_mtime_ns, content_hash)
+
+    def directories(self) -> List[str]:
+        """
+        :return: the (expanded) directories config files are searched in
+        """
+        return list(map(lambda x: os.path.expanduser(x), self.paths))
+
+    def file_signature(self) -> Optional[Tuple]:
+        """
+        Cheaply identifies the current state of the config file without reading it
+        :return: (path, inode, size, modification time) of the config file, or None if there is none
+        """
+        file_path = self._find_config_file()
+        if file_path is None:
+            return None
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return file_path, stat.st_ino, stat.st_size, stat.st_mtime_ns
 
     def _load(self) -> Dict:
         file_path = self._find_config_file()
         if file_path is None:
             LOGGER.debug("No config file found in paths: {}".format(self.paths))
+            self._release_shared()
             return {}
 
-        return self._load_file(file_path)
+        if not self.shared:
+            return self._load_file(file_path)
+        return self._load_shared(file_path)
+
+    def _load_shared(self, file_path: str) -> Dict:
+        """
+        Retrieves the file content from the shared source cache, parsing it only if necessary
+        :param file_path: the path of the file to load
+        :return: file content as a dictionary
+        """
+        from container_app_conf.source.shared_cache import SHARED_SOURCE_CACHE
+
+        stat = os.stat(file_path)
+        if time.time_ns() - stat.st_mtime_ns <= self.RACY_MODIFICATION_WINDOW:
+            # further modifications might not change the stat signature, so don't share
+            self._release_shared()
+            return self._load_file(file_path)
+
+        key = (type(self), self._loader_options(), file_path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        root = SHARED_SOURCE_CACHE.acquire(key, lambda: self._load_file(file_path))
+        # acquire first, so the entry isn't dropped in between when it is still the same
+        self._release_shared()
+        self._shared_reference = weakref.finalize(self, SHARED_SOURCE_CACHE.release, key)
+        return root
+
+    def _loader_options(self) -> Tuple:
+        """
+        :return: options affecting the result of _load_file(), sources only share file content if they are equal
+        """
+        return ()
+
+    def _release_shared(self):
+        """
+        Releases the reference to the shared file content currently in use (if any)
+        """
+        if self._shared_reference is not None:
+            self._shared_reference()
+            self._shared_reference = None
+
+    def prune(self, entries: Iterable[EntrySpec]):
+        super().prune(entries)
+        # the pruned tree is a copy
+        self._release_shared()
+
+    def release(self):
+        super().release()
+        self._release_shared()
 
     def _load_file(self, file_path: str) -> Dict:
         """
@@ -155,17 +397,61 @@ class FilesystemSource(DataSource):
 
     def _find_config_file(self) -> Optional[str]:
         """
-        Tries to find a usable config file
+        Tries to find a usable config file.
+        Every directory is scanned at most once, the result is reused until one of the scanned directories is modified.
         :return: file path or None
         """
-        import os
+        candidates = tuple("{}.{}".format(file_name, extension)
+                           for extension in self.file_extensions
+                           for file_name in self.file_names)
+        directories = self.directories()
 
-        for path in self.paths:
-            path = os.path.expanduser(path)
-            for extension in self.file_extensions:
-                for file_name in self.file_names:
-                    file_path = os.path.join(path, "{}.{}".format(file_name, extension))
-                    if os.path.isfile(file_path):
-                        return file_path
+        discovery = self._discovery
+        if discovery is not None and discovery.reusable and discovery.candidates == candidates:
+            scanned = list(map(lambda x: x[0], discovery.directories))
+            if directories[:len(scanned)] == scanned and all(
+                    map(lambda x: self._directory_mtime(x[0]) == x[1], discovery.directories)):
+                return discovery.file_path
 
-        return None
+        now = time.time_ns()
+        scanned = []
+        file_path = None
+        for directory in directories:
+            # stat before scanning, so modifications during the scan are detected later on
+            mtime = self._directory_mtime(directory)
+            scanned.append((directory, mtime))
+            file_name = self._scan_directory(directory, candidates)
+            if file_name is not None:
+                file_path = os.path.join(directory, file_name)
+                break
+
+        reusable = all(map(lambda x: x[1] is None or now - x[1] > self.RACY_MODIFICATION_WINDOW, scanned))
+        self._discovery = FileDiscovery(candidates, tuple(scanned), reusable, file_path, now / 1e9)
+        return file_path
+
+    @staticmethod
+    def _directory_mtime(directory: str) -> Optional[int]:
+        """
+        :param directory: directory path
+        :return: modification time of the given directory in nanoseconds, None if it doesn't exist
+        """
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _scan_directory(directory: str, candidates: Tuple[str, ...]) -> Optional[str]:
+        """
+        Searches a directory for config files
+        :param directory: the directory to scan
+        :param candidates: file names to search for, in order of precedence
+        :return: the first candidate that is a file in the given directory, or None
+        """
+        try:
+            with os.scandir(directory) as entries:
+                found = set(map(lambda x: x.name, filter(lambda x: x.name in candidates and x.is_file(), entries)))
+        except OSError:
+            return None
+
+        return next(filter(lambda x: x in found, candidates), None)
@@ -0,0 +1,369 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import logging
+import mmap
+import os
+import struct
+from datetime import datetime, date, time, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Iterable, Optional
+
+from container_app_conf.entry import ConfigEntry, EntrySpec
+from container_app_conf.source import DataSource, FilesystemSource, MISSING
+
+LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"CACBIN01"
+# magic, number of entries, offset of the entry table
+HEADER = struct.Struct("<8sIQ")
+# offset of the key, length of the key, offset of the value
+TABLE_RECORD = struct.Struct("<QIQ")
+KEY_SEPARATOR = b"\x00"
+
+UINT32 = struct.Struct("<I")
+UINT64 = struct.Struct("<Q")
+INT64 = struct.Struct("<q")
+FLOAT64 = struct.Struct("<d")
+TIMEDELTA = struct.Struct("<iii")
+
+TAG_NONE = b"N"
+TAG_TRUE = b"T"
+TAG_FALSE = b"F"
+TAG_INT = b"i"
+# integers exceeding 64 bit, stored as decimal string
+TAG_BIG_INT = b"I"
+TAG_FLOAT = b"f"
+TAG_STR = b"s"
+TAG_DATETIME = b"d"
+TAG_DATE = b"a"
+TAG_TIME = b"c"
+TAG_TIMEDELTA = b"r"
+TAG_LIST = b"l"
+TAG_DICT = b"m"
+
+
+def _encode_key(key_path: Iterable[Any]) -> bytes:
+    """
+    :param key_path: key path
+    :return: binary representation of the given key path used in the entry table
+    """
+    return KEY_SEPARATOR.join(map(lambda x: str(x).encode(), key_path))
+
+
+class _BinarySnapshotWriter:
+    """
+    Serializes a value tree. Values are written before the containers referencing them,
+    every node of the tree is listed in the entry table (sorted by key) so it can be looked up directly.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray(HEADER.size)
+        self._table = []
+
+    def write(self, root: Dict) -> bytes:
+        """
+        :param root: value tree
+        :return: the binary snapshot
+        """
+        self._write_node((), root)
+
+        keys = []
+        for key, value_offset in sorted(self._table):
+            keys.append((len(self._buffer), len(key), value_offset))
+            self._buffer += key
+
+        table_offset = len(self._buffer)
+        for record in keys:
+            self._buffer += TABLE_RECORD.pack(*record)
+
+        HEADER.pack_into(self._buffer, 0, MAGIC, len(keys), table_offset)
+        return bytes(self._buffer)
+
+    def _write_node(self, key_path: Optional[Tuple[Any, ...]], value: Any) -> int:
+        """
+        Writes a value (and all values contained in it)
+        :param key_path: key path of the value, None for values that can not be looked up (like list items)
+        :param value: the value
+        :return: offset of the value
+        """
+        if isinstance(value, dict):
+            items = list(map(lambda x: (
+                str(x[0]).encode(),
+                self._write_node(None if key_path is None else key_path + (x[0],), x[1])
+            ), value.items()))
+            offset = self._append(TAG_DICT, UINT32.pack(len(items)))
+            for key, item_offset in items:
+                self._buffer += UINT32.pack(len(key)) + key + UINT64.pack(item_offset)
+        elif isinstance(value, (list, tuple)):
+            item_offsets = list(map(lambda x: self._write_node(None, x), value))
+            offset = self._append(TAG_LIST, UINT32.pack(len(item_offsets)),
+                                  b"".join(map(lambda x: UINT64.pack(x), item_offsets)))
+        else:
+            offset = self._write_value(value)
+
+        # data sources don't provide None values
+        if key_path is not None and value is not None:
+            self._table.append((_encode_key(key_path), offset))
+        return offset
+
+    def _write_value(self, value: Any) -> int:
+        """
+        Writes a scalar value
+        :param value: the value
+        :return: offset of the value
+        """
+        if value is None:
+            return self._append(TAG_NONE)
+        if isinstance(value, bool):
+            return self._append(TAG_TRUE if value else TAG_FALSE)
+        if isinstance(value, int):
+            if -2 ** 63 <= value < 2 ** 63:
+                return self._append(TAG_INT, INT64.pack(value))
+            return self._append_str(TAG_BIG_INT, str(int(value)))
+        if isinstance(value, float):
+            return self._append(TAG_FLOAT, FLOAT64.pack(value))
+        if isinstance(value, str):
+            return self._append_str(TAG_STR, str(value))
+        # datetime is a subclass of date
+        if isinstance(value, datetime):
+            return self._append_str(TAG_DATETIME, value.isoformat())
+        if isinstance(value, date):
+            return self._append_str(TAG_DATE, value.isoformat())
+        if isinstance(value, time):
+            return self._append_str(TAG_TIME, value.isoformat())
+        if isinstance(value, timedelta):
+            return self._append(TAG_TIMEDELTA, TIMEDELTA.pack(value.days, value.seconds, value.microseconds))
+
+        raise ValueError("Unsupported value type: {}".format(type(value)))
+
+    def _append(self, tag: bytes, *parts: bytes) -> int:
+        offset = len(self._buffer)
+        self._buffer += tag
+        for part in parts:
+            self._buffer += part
+        return offset
+
+    def _append_str(self, tag: bytes, value: str) -> int:
+        encoded = value.encode()
+        return self._append(tag, UINT32.pack(len(encoded)), encoded)
+
+
+def write_binary_snapshot(root: Dict, path: str | Path):
+    """
+    Writes a value tree to a binary snapshot file
+    :param root: value tree
+    :param path: path of the file to write
+    """
+    data = _BinarySnapshotWriter().write(root)
+
+    path = Path(path).expanduser()
+    os.makedirs(path.parent, exist_ok=True)
+    # never modify a file in place, readers might have mapped it
+    tmp_path = path.with_name("{}.{}.tmp".format(path.name, os.getpid()))
+    with open(tmp_path, 'wb') as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+
+
+def convert_source(source: DataSource, path: str | Path):
+    """
+    Converts all values of a data source (f.ex. a YamlSource, TomlSource or JsonSource) to a binary snapshot file
+    :param source: the data source to convert
+    :param path: path of the file to write
+    """
+    source.load()
+    write_binary_snapshot(source.root, path)
+
+
+def convert_config(config, path: str | Path):
+    """
+    Writes the resolved values of a config object to a binary snapshot file
+    :param config: the config object
+    :param path: path of the file to write
+    """
+    snapshot = config.snapshot()
+    root = {}
+    written = set()
+    # parents first, values of children are contained in the value of their parent already
+    for spec in sorted(config._entry_specs, key=lambda x: len(x.key_path)):
+        if any(map(lambda x: spec.key_path[:x] in written, range(1, len(spec.key_path)))):
+            continue
+
+        value = snapshot[config._config_entries[spec.attribute_name]]
+        if value is None:
+            continue
+        if not isinstance(value, (bool, int, float, str, date, time, timedelta, list, dict)):
+            value = spec.entry._type_to_value(value)
+
+        written.add(spec.key_path)
+        node = root
+        for key in spec.key_path[:-1]:
+            node = node.setdefault(key, {})
+        node[spec.key_path[-1]] = value
+
+    write_binary_snapshot(root, path)
+
+
+class BinarySnapshotReader:
+    """
+    Reads a binary snapshot file. The file is memory mapped and values are only decoded when looked up.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        :param path: path of the binary snapshot file
+        """
+        with open(path, 'rb') as file:
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._count, self._table_offset = HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            self._data.close()
+            raise ValueError("Not a binary config snapshot: {}".format(path))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, key_path: Iterable[Any]) -> Any:
+        """
+        Looks up a value by its key path
+        :param key_path: key path of the value, an empty key path yields the whole value tree
+        :return: the decoded value, or MISSING if there is no value for the given key path
+        """
+        key = _encode_key(key_path)
+
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, value_offset = TABLE_RECORD.unpack_from(
+                self._data, self._table_offset + middle * TABLE_RECORD.size)
+            current = self._data[key_offset:key_offset + key_length]
+            if current == key:
+                return self._decode(value_offset)
+            if current < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return MISSING
+
+    def _decode(self, offset: int) -> Any:
+        """
+        :param offset: offset of the value
+        :return: the decoded value
+        """
+        data = self._data
+        tag = data[offset:offset + 1]
+        offset += 1
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_TRUE:
+            return True
+        if tag == TAG_FALSE:
+            return False
+        if tag == TAG_INT:
+            return INT64.unpack_from(data, offset)[0]
+        if tag == TAG_FLOAT:
+            return FLOAT64.unpack_from(data, offset)[0]
+        if tag == TAG_TIMEDELTA:
+            days, seconds, microseconds = TIMEDELTA.unpack_from(data, offset)
+            return timedelta(days=days, seconds=seconds, microseconds=microseconds)
+        if tag == TAG_LIST:
+            count = UINT32.unpack_from(data, offset)[0]
+            offset += UINT32.size
+            return list(map(lambda x: self._decode(UINT64.unpack_from(data, offset + x * UINT64.size)[0]),
+                            range(count)))
+        if tag == TAG_DICT:
+            count = UINT32.unpack_from(data, offset)[0]
+            offset += UINT32.size
+            result = {}
+            for _ in range(count):
+                key_length = UINT32.unpack_from(data, offset)[0]
+                offset += UINT32.size
+                key = data[offset:offset + key_length].decode()
+                offset += key_length
+                result[key] = self._decode(UINT64.unpack_from(data, offset)[0])
+                offset += UINT64.size
+            return result
+
+        length = UINT32.unpack_from(data, offset)[0]
+        offset += UINT32.size
+        text = data[offset:offset + length].decode()
+        if tag == TAG_STR:
+            return text
+        if tag == TAG_BIG_INT:
+            return int(text)
+        if tag == TAG_DATETIME:
+            return datetime.fromisoformat(text)
+        if tag == TAG_DATE:
+            return date.fromisoformat(text)
+        if tag == TAG_TIME:
+            return time.fromisoformat(text)
+
+        raise ValueError("Invalid binary config snapshot, unknown type tag {!r} at offset {}".format(tag, offset - 1))
+
+    def close(self):
+        """
+        Unmaps the file, values can not be looked up anymore afterwards
+        """
+        self._data.close()
+
+
+class BinarySnapshotSource(FilesystemSource):
+    """
+    Data source utilizing binary snapshot files (see convert_source() and convert_config()).
+    Files are memory mapped, only values that are looked up are decoded.
+    """
+    DEFAULT_FILE_EXTENSIONS = ['bin']
+
+    def __init__(self, file_name: str | List[str],
+                 path: str | List[str] = None,
+                 file_extension: str | List[str] = None):
+        """
+        :param path: allowed config file path(s)
+        :param file_name: allowed config file name(s)
+        :param file_extension: allowed config file extension(s)
+        """
+        super().__init__(file_name, path, file_extension)
+        self._reader: Optional[BinarySnapshotReader] = None
+
+    def load(self):
+        file_path = self._find_config_file()
+        if file_path is None:
+            LOGGER.debug("No config file found in paths: {}".format(self.paths))
+        # the previous mapping is closed once it is not referenced anymore
+        self._reader = None if file_path is None else BinarySnapshotReader(file_path)
+
+    def _load_file(self, file_path: str) -> Dict:
+        return BinarySnapshotReader(file_path).get(())
+
+    def _lookup(self, entry: ConfigEntry | EntrySpec) -> Any:
+        reader = self._reader
+        if reader is None:
+            return MISSING
+        return reader.get(entry.key_path)
+
+    def prune(self, entries: Iterable[EntrySpec]):
+        # values are only decoded when looked up, there is nothing to prune
+        pass
+
+    def release(self):
+        super().release()
+        self._reader = None
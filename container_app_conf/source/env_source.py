@@ -17,12 +17,12 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
-import copy
+import hashlib
 import os
-from typing import Optional, Dict
+from typing import Dict, Any, Iterable, Optional, Tuple
 
-from container_app_conf import ConfigEntry
-from container_app_conf.source import DataSource
+from container_app_conf.entry import ConfigEntry, EntrySpec
+from container_app_conf.source import DataSource, MISSING
 
 
 class EnvSource(DataSource):
@@ -31,19 +31,102 @@ class EnvSource(DataSource):
     """
     KEY_SPLIT_CHAR = "_"
 
-    def has(self, entry: ConfigEntry) -> bool:
-        original_key = self.env_key(entry)
-        normalized_key = original_key.replace('-', '_')
-        return original_key in self.root.keys() or normalized_key in self.root.keys()
+    def __init__(self, ignore_case_in_keys: bool = False, prefix: str = None):
+        """
+        Constructor
+        :param ignore_case_in_keys: whether to ignore case in keys
+        :param prefix: prefix of all environment variables used by the application (f.ex. "MYAPP_"),
+                       any other variable is ignored
+        """
+        super().__init__(ignore_case_in_keys)
+        self.prefix = "" if prefix is None else prefix
+        # digest of the variables at the time of the last load
+        self._digest = None
+        # keys precomputed by config classes can only be used if the naming of variables is not customized
+        self._use_spec_keys = type(self).env_key is EnvSource.env_key and type(self).env_keys is EnvSource.env_keys
 
-    def get(self, entry: ConfigEntry) -> Optional[str]:
-        original_key = self.env_key(entry)
-        normalized_key = original_key.replace('-', '_')
-        return self.root.get(original_key, self.root.get(normalized_key, None))
+    def _lookup(self, entry: ConfigEntry | EntrySpec) -> Any:
+        for key in self._keys(entry):
+            value = self.root.get(key, MISSING)
+            if value is not MISSING:
+                return value
+        return MISSING
+
+    def prune(self, entries: Iterable[EntrySpec]):
+        keys = set(key for entry in entries for key in self._keys(entry))
+        self.root = {key: value for key, value in self.root.items() if key in keys}
+
+    def has_changed(self) -> bool:
+        if self._digest is None:
+            return True
+        return self._environment_digest(self._read_environment()) != self._digest
+
+    def fingerprint(self, entries: Iterable[EntrySpec]) -> Optional[str]:
+        digest = hashlib.sha256()
+        for entry in entries:
+            for key in self._keys(entry):
+                key = self.prefix + key
+                value = os.environ.get(key, None)
+                digest.update("{}={!r};".format(key, value).encode())
+        return digest.hexdigest()
 
     @staticmethod
     def env_key(entry: ConfigEntry) -> str:
         return EnvSource.KEY_SPLIT_CHAR.join(entry.key_path).upper()
 
+    def env_keys(self, entry: ConfigEntry) -> Tuple[str, ...]:
+        """
+        :param entry: the config entry
+        :return: names of the environment variables (without prefix) that may hold the value of the given entry,
+                 in order of precedence
+        """
+        return self.candidate_keys(self.env_key(entry))
+
+    @staticmethod
+    def candidate_keys(original_key: str) -> Tuple[str, ...]:
+        """
+        :param original_key: the environment variable name of an entry, see env_key()
+        :return: the given name and its normalized form (if different), in order of precedence
+        """
+        normalized_key = original_key.replace('-', '_')
+        if normalized_key == original_key:
+            return original_key,
+        return original_key, normalized_key
+
+    def _keys(self, entry: ConfigEntry | EntrySpec) -> Tuple[str, ...]:
+        """
+        :param entry: the config entry
+        :return: see env_keys()
+        """
+        if isinstance(entry, EntrySpec):
+            if self._use_spec_keys:
+                return entry.env_keys
+            entry = entry.entry
+        return self.env_keys(entry)
+
     def _load(self) -> Dict:
-        return copy.deepcopy(os.environ)
+        variables = self._read_environment()
+        self._digest = self._environment_digest(variables)
+        return variables
+
+    def _read_environment(self) -> Dict[str, str]:
+        """
+        :return: flat copy of the variables this source is responsible for, without their prefix
+        """
+        prefix_length = len(self.prefix)
+        return {key[prefix_length:]: value for key, value in os.environ.items() if key.startswith(self.prefix)}
+
+    @staticmethod
+    def _environment_digest(variables: Dict[str, str]) -> str:
+        """
+        :param variables: environment variables
+        :return: digest of the given variables
+        """
+        digest = hashlib.sha256()
+        for key, value in sorted(variables.items()):
+            digest.update("{}={!r};".format(key, value).encode())
+        return digest.hexdigest()
+
+    def _build_index(self, root: Dict) -> Dict:
+        # environment variables are looked up by their key directly
+        return {}
@@ -0,0 +1,91 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import threading
+from typing import Dict, Callable, Hashable
+
+
+class _SharedEntry:
+    __slots__ = ("root", "references")
+
+    def __init__(self, root: Dict):
+        self.root = root
+        self.references = 0
+
+
+class SharedSourceCache:
+    """
+    Process wide cache of parsed config files, so multiple data sources reading the same file
+    (f.ex. of different config classes or non-singleton instances) only parse it once.
+    Entries are reference counted and dropped as soon as no data source uses them anymore.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, _SharedEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def acquire(self, key: Hashable, load: Callable[[], Dict]) -> Dict:
+        """
+        Retrieves the value tree stored for the given key, loading it if necessary,
+        and adds a reference to it. Every call must be paired with a call to release().
+        :param key: identifies the file and its state (f.ex. path and stat signature)
+        :param load: function to load the value tree if there is none for the given key
+        :return: the (shared) value tree
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                entry.references += 1
+                return entry.root
+
+        # parse without holding the lock, so other files can be loaded concurrently
+        root = load()
+        with self._lock:
+            entry = self._entries.setdefault(key, _SharedEntry(root))
+            entry.references += 1
+            return entry.root
+
+    def release(self, key: Hashable):
+        """
+        Removes a reference added by acquire(), the entry is dropped when there are no references left
+        :param key: the key passed to acquire()
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return
+
+            entry.references -= 1
+            if entry.references <= 0:
+                self._entries.pop(key)
+
+    def references(self, key: Hashable) -> int:
+        """
+        :param key: the key passed to acquire()
+        :return: number of references to the entry of the given key
+        """
+        entry = self._entries.get(key, None)
+        return 0 if entry is None else entry.references
+
+
+# the cache used by all data sources of this process
+SHARED_SOURCE_CACHE = SharedSourceCache()
@@ -20,8 +20,6 @@
 import logging
 from typing import Dict
 
-import toml
-
 from container_app_conf.formatter.toml import TomlFormatter
 from container_app_conf.source import FilesystemSource
 
@@ -37,5 +35,7 @@ class TomlSource(FilesystemSource):
     formatter = TomlFormatter()
 
     def _load_file(self, file_path: str) -> Dict:
+        import toml
+
         with open(file_path, 'r') as file:
             return toml.load(file)
@@ -18,26 +18,76 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 import logging
-from typing import Dict
+import threading
+from typing import Dict, List, Tuple
 
-from ruamel.yaml import YAML
-
-from container_app_conf.formatter.yaml import YamlFormatter
+from container_app_conf.formatter.yaml import YamlFormatter, LazyYaml, create_yaml
 from container_app_conf.source import FilesystemSource
 
 LOGGER = logging.getLogger(__name__)
 
 
+class _ThreadLocalYaml(LazyYaml):
+    """
+    YAML instances are not thread safe, so every thread uses its own instance (per loader type) for loading.
+    Accessed through the class, a (shared) round trip instance is returned, like a plain class attribute.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._thread_local = threading.local()
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return super().__get__(instance, owner)
+
+        instances = getattr(self._thread_local, "instances", None)
+        if instances is None:
+            instances = {}
+            self._thread_local.instances = instances
+
+        key = (instance.typ, instance.pure)
+        yaml = instances.get(key, None)
+        if yaml is None:
+            yaml = create_yaml(instance.typ, instance.pure)
+            instances[key] = yaml
+        return yaml
+
+
 class YamlSource(FilesystemSource):
     """
     Data source utilizing YAML files
     """
     DEFAULT_FILE_EXTENSIONS = ['yaml', 'yml']
     formatter = YamlFormatter()
+    # the YAML instance used for parsing, ruamel.yaml is only imported on first use
+    yaml = _ThreadLocalYaml()
+
+    def __init__(self, file_name: str | List[str],
+                 path: str | List[str] = None,
+                 file_extension: str | List[str] = None,
+                 ignore_case_in_keys: bool = False,
+                 typ: str = 'rt',
+                 pure: bool = False,
+                 shared: bool = False):
+        """
+        :param path: allowed config file path(s)
+        :param file_name: allowed config file name(s)
+        :param file_extension: allowed config file extension(s)
+        :param ignore_case_in_keys: whether to ignore case in keys
+        :param typ: the ruamel.yaml loader to use, "rt" (round trip) keeps comments and formatting,
+                    "safe" is considerably faster and only returns plain dicts and lists
+                    (using the C based loader of ruamel.yaml.clib if it is installed)
+        :param pure: whether to use the pure python loader, even if the C based loader is available
+        :param shared: whether to share the parsed file content with all other shared data sources
+                       of this process reading the same file (see SharedSourceCache)
+        """
+        super().__init__(file_name, path, file_extension, ignore_case_in_keys, shared)
+        self.typ = typ
+        self.pure = pure
 
-    yaml = YAML()
-    yaml.default_style = False
-    yaml.default_flow_style = False
+    def _loader_options(self) -> Tuple:
+        return self.typ, self.pure
 
     def _load_file(self, file_path: str) -> Dict:
         with open(file_path, 'r') as ymlfile:
@@ -22,7 +22,6 @@ from pathlib import Path
 from typing import List, Dict
 
 from container_app_conf import ConfigEntry, ConfigFormatter
-from container_app_conf.formatter.yaml import YamlFormatter
 
 
 def find_duplicates(l: list) -> Dict:
@@ -92,14 +91,18 @@ def regex_deepcopy_36_workaround():
     copy._deepcopy_dispatch[type(re.compile(''))] = lambda r, _: r
 
 
-def write_reference(config, path: str | Path, formatter: ConfigFormatter = YamlFormatter()):
+def write_reference(config, path: str | Path, formatter: ConfigFormatter = None):
     """
     Writes an example configuration to the given path.
     :param config:
     :param path:
-    :param formatter:
+    :param formatter: the formatter to use, defaults to YamlFormatter
     :return:
     """
+    if formatter is None:
+        from container_app_conf.formatter.yaml import YamlFormatter
+        formatter = YamlFormatter()
+
     path = Path(path).expanduser().resolve()
     if path.exists() and not path.is_file():
         raise AssertionError("Path exists and is not a file: {}".format(path))
@@ -0,0 +1,183 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import sys
+import threading
+from typing import List, Optional
+
+from container_app_conf.source import FilesystemSource
+
+LOGGER = logging.getLogger(__name__)
+
+# inotify event flags, see inotify(7)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+
+INOTIFY_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | \
+               IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+
+
+class _Waiter:
+    """
+    Blocks until something might have changed (stat polling)
+    """
+
+    def __init__(self, stop_event: threading.Event):
+        self._stop_event = stop_event
+
+    def wait(self, timeout: float):
+        """
+        Blocks until a change might have happened or the timeout is reached
+        :param timeout: timeout in seconds
+        """
+        self._stop_event.wait(timeout)
+
+    def close(self):
+        pass
+
+
+class _InotifyWaiter(_Waiter):
+    """
+    Blocks until inotify reports an event in one of the watched directories
+    """
+
+    def __init__(self, stop_event: threading.Event, fd: int):
+        super().__init__(stop_event)
+        self._fd = fd
+
+    @staticmethod
+    def create(stop_event: threading.Event, directories: List[str]) -> Optional['_InotifyWaiter']:
+        """
+        :param stop_event: event signaling the watcher to stop
+        :param directories: directories to watch
+        :return: an inotify based waiter, or None if inotify is not available
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as ex:
+            LOGGER.debug("inotify is not available: {}".format(ex))
+            return None
+        if fd < 0:
+            return None
+
+        for directory in directories:
+            if libc.inotify_add_watch(fd, os.fsencode(directory), INOTIFY_MASK) < 0:
+                LOGGER.debug("Cannot watch directory: {}".format(directory))
+
+        return _InotifyWaiter(stop_event, fd)
+
+    def wait(self, timeout: float):
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if len(readable) <= 0:
+            return
+
+        # drain all pending events, we only care about the fact that something happened
+        try:
+            while len(os.read(self._fd, 65536)) > 0:
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self):
+        os.close(self._fd)
+
+
+class ConfigWatcher(threading.Thread):
+    """
+    Watches the config files of all filesystem data sources of a config
+    and reloads data sources when their config file has changed.
+    Uses inotify where available and falls back to stat polling otherwise.
+    """
+
+    def __init__(self, config, interval: float = 1.0):
+        """
+        :param config: the config to watch
+        :param interval: maximum delay in seconds until a change is detected
+        """
+        super().__init__(name="{}-watcher".format(config.__class__.__name__), daemon=True)
+        self.config = config
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._sources = list(filter(lambda x: isinstance(x[1], FilesystemSource), enumerate(config.data_sources)))
+        self._signatures = {index: source.file_signature() for index, source in self._sources}
+
+    def stop(self):
+        """
+        Stops watching
+        """
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+    def run(self):
+        directories = []
+        for _, source in self._sources:
+            for directory in source.directories():
+                if directory not in directories and os.path.isdir(directory):
+                    directories.append(directory)
+
+        waiter = _InotifyWaiter.create(self._stop_event, directories) or _Waiter(self._stop_event)
+        try:
+            while not self._stop_event.is_set():
+                waiter.wait(self.interval)
+                if self._stop_event.is_set():
+                    break
+                self.check()
+        finally:
+            waiter.close()
+
+    def check(self):
+        """
+        Checks all watched config files for changes and reloads the data sources of changed files
+        """
+        signatures = {}
+        for index, source in self._sources:
+            signature = source.file_signature()
+            if signature != self._signatures[index]:
+                signatures[index] = signature
+
+        if len(signatures) <= 0:
+            return
+
+        changed = list(signatures.keys())
+        LOGGER.debug("Reloading changed data sources: {}".format(changed))
+        try:
+            self.config._reload_sources(changed)
+        except Exception as ex:
+            # signatures are kept, so the files are reloaded again on the next check
+            LOGGER.exception(ex)
+            return
+
+        self._signatures.update(signatures)
@@ -18,8 +18,10 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+import os
 import unittest
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Tuple
 
 from py_range_parse import Range
@@ -38,6 +40,12 @@ from container_app_conf.entry.regex import RegexConfigEntry
 from container_app_conf.entry.string import StringConfigEntry
 from container_app_conf.entry.timedelta import TimeDeltaConfigEntry
 
+# root directory of the repository, tests might be run from within the tests directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# benchmarks compare wall clock times, which is unreliable on busy machines, so they only run on demand
+benchmark = unittest.skipUnless(os.environ.get("RUN_BENCHMARKS", "0") != "0", "set RUN_BENCHMARKS=1 to run benchmarks")
+
 
 class TestConfigBase2(ConfigBase):
     BOOL = BoolConfigEntry(
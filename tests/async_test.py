@@ -0,0 +1,187 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import asyncio
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict
+
+from container_app_conf import ConfigBase
+from container_app_conf.entry.int import IntConfigEntry
+from container_app_conf.entry.string import StringConfigEntry
+from container_app_conf.source.json_source import JsonSource
+from container_app_conf.source.toml_source import TomlSource
+from tests import TestBase
+
+
+class AsyncConfig(ConfigBase):
+    STRING = StringConfigEntry(
+        key_path=["testing", "key1"],
+        default="default"
+    )
+    INT = IntConfigEntry(
+        key_path=["testing", "key2"],
+        default=1
+    )
+
+
+class AsyncSingletonConfig(ConfigBase):
+    STRING = StringConfigEntry(
+        key_path=["testing", "key1"],
+        default="default"
+    )
+
+
+class CountingJsonSource(JsonSource):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.load_count = 0
+
+    def _load(self) -> Dict:
+        self.load_count += 1
+        return super()._load()
+
+
+class BarrierJsonSource(JsonSource):
+    # if set, loading blocks until all sources sharing the barrier are loading
+    barrier = None
+
+    def _load(self) -> Dict:
+        if self.barrier is not None:
+            self.barrier.wait()
+        return super()._load()
+
+
+class ObservedLock:
+    """
+    Signals when a thread has to wait for the wrapped lock
+    """
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.waiting = threading.Event()
+
+    def __enter__(self):
+        if not self.lock.acquire(blocking=False):
+            self.waiting.set()
+            self.lock.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.lock.release()
+
+
+class TestAsync(TestBase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.json_file = Path(self._directory.name, "async.json")
+        self.json_file.write_text('{"testing": {"key1": "json"}}')
+        Path(self._directory.name, "async.toml").write_text('[testing]\nkey1 = "toml"\nkey2 = 2\n')
+        self.data_sources = [
+            JsonSource("async", self._directory.name),
+            TomlSource("async", self._directory.name),
+        ]
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_acreate(self):
+        config = asyncio.run(AsyncConfig.acreate(data_sources=self.data_sources, singleton=False))
+
+        self.assertEqual("json", config.STRING.value)
+        self.assertEqual(2, config.INT.value)
+
+    def test_acreate_singleton(self):
+        source = CountingJsonSource("async", self._directory.name)
+
+        async def run():
+            return await asyncio.gather(*map(lambda x: AsyncSingletonConfig.acreate(data_sources=[source]), range(8)))
+
+        instances = asyncio.run(run())
+        self.assertEqual(1, source.load_count)
+        for instance in instances:
+            self.assertIs(AsyncSingletonConfig(), instance)
+        self.assertEqual("json", AsyncSingletonConfig.STRING.value)
+
+    def test_aload_waits_for_reload(self):
+        config = AsyncConfig(data_sources=self.data_sources, singleton=False)
+        self.json_file.write_text('{"testing": {"key1": "changed"}}')
+
+        reload_lock = ObservedLock(config._reload_lock)
+        config._reload_lock = reload_lock
+
+        async def run():
+            # f.ex. the watcher reloading a source
+            with reload_lock.lock:
+                task = asyncio.ensure_future(config.aload())
+                waiting = await asyncio.get_running_loop().run_in_executor(None, reload_lock.waiting.wait, 5)
+                self.assertTrue(waiting)
+                self.assertFalse(task.done())
+                self.assertEqual("json", config.STRING.value)
+            await task
+
+        asyncio.run(run())
+        self.assertEqual("changed", config.STRING.value)
+
+    def test_aload_concurrently(self):
+        Path(self._directory.name, "async2.json").write_text('{"testing": {"key2": 2}}')
+        sources = [
+            BarrierJsonSource("async", self._directory.name),
+            BarrierJsonSource("async2", self._directory.name),
+        ]
+        config = AsyncConfig(data_sources=sources, singleton=False)
+
+        self.json_file.write_text('{"testing": {"key1": "changed"}}')
+        Path(self._directory.name, "async2.json").write_text('{"testing": {"key2": 30}}')
+        # both changed sources have to be loading at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        for source in sources:
+            source.barrier = barrier
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            asyncio.run(config.aload(executor=executor))
+
+        self.assertEqual("changed", config.STRING.value)
+        self.assertEqual(30, config.INT.value)
+
+    def test_changes(self):
+        async def run():
+            config = await AsyncConfig.acreate(data_sources=self.data_sources, singleton=False)
+            changes = config.changes()
+            next_change = asyncio.ensure_future(changes.__anext__())
+            # make sure the listener is registered
+            await asyncio.sleep(0)
+
+            self.json_file.write_text('{"testing": {"key1": "changed"}}')
+            await config.aload()
+
+            change = await asyncio.wait_for(next_change, 5)
+            await changes.aclose()
+            return config, change
+
+        config, change = asyncio.run(run())
+
+        self.assertIs(config.STRING, change.entry)
+        self.assertEqual("json", change.old_value)
+        self.assertEqual("changed", change.new_value)
+        self.assertEqual(0, len(config._listeners))
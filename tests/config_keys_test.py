@@ -20,7 +20,7 @@
 from container_app_conf import ConfigBase
 from container_app_conf.entry.bool import BoolConfigEntry
 from container_app_conf.entry.string import StringConfigEntry
-from tests import TestBase
+from tests import TestBase, TestConfigBase
 
 
 class TestConfigBaseClashing(ConfigBase):
@@ -49,3 +49,16 @@ class TestClashingKeys(TestBase):
     def test_clashing_keys(self):
         with self.assertRaises(ValueError):
             TestConfigBaseClashing()
+
+    def test_entry_specs(self):
+        specs = {spec.attribute_name: spec for spec in TestConfigBase._entry_specs}
+        self.assertEqual(len(TestConfigBase()._config_entries), len(specs))
+
+        spec = specs["TIMEDELTA"]
+        self.assertIs(TestConfigBase.TIMEDELTA, spec.entry)
+        self.assertEqual(("test", "this", "timediff", "is", "in", "this", "branch"), spec.key_path)
+        self.assertEqual("test->this->timediff->is->in->this->branch", spec.name)
+        self.assertEqual("TEST_THIS_TIMEDIFF_IS_IN_THIS_BRANCH", spec.env_key)
+
+        for index, spec in enumerate(TestConfigBase._entry_specs):
+            self.assertEqual(index, spec.index)
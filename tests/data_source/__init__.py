@@ -36,8 +36,7 @@ class MemoryDataSource(DataSource):
             key_path = entry.key_path
             current_level = data
             for key in key_path[:-1]:
-                current_level[key] = {}
-                current_level = current_level[key]
+                current_level = current_level.setdefault(key, {})
             current_level[key_path[-1]] = value
 
         return data
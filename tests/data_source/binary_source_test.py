@@ -0,0 +1,124 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import tempfile
+from datetime import datetime, date, timedelta, timezone
+from pathlib import Path
+
+from container_app_conf import ConfigBase
+from container_app_conf.entry.date import DateConfigEntry
+from container_app_conf.entry.dict import DictConfigEntry
+from container_app_conf.entry.int import IntConfigEntry
+from container_app_conf.entry.list import ListConfigEntry
+from container_app_conf.entry.string import StringConfigEntry
+from container_app_conf.entry.timedelta import TimeDeltaConfigEntry
+from container_app_conf.source import MISSING
+from container_app_conf.source.binary_source import BinarySnapshotReader, BinarySnapshotSource, \
+    write_binary_snapshot, convert_source, convert_config
+from container_app_conf.source.json_source import JsonSource
+from tests import TestBase
+
+
+class BinaryConfig(ConfigBase):
+    STRING = StringConfigEntry(
+        key_path=["testing", "key1"],
+        default="default"
+    )
+    INT = IntConfigEntry(
+        key_path=["testing", "key2"],
+        default=1
+    )
+    DATE = DateConfigEntry(
+        key_path=["types", "date"],
+        default=datetime(2019, 10, 22, 4, 21, 2, tzinfo=timezone.utc)
+    )
+    TIMEDELTA = TimeDeltaConfigEntry(
+        key_path=["types", "timedelta"],
+        default="4h32m1s"
+    )
+    LIST = ListConfigEntry(
+        item_type=IntConfigEntry,
+        key_path=["types", "list"],
+        default=[1, 2, 3]
+    )
+    DICT = DictConfigEntry(
+        key_path=["types", "dict"],
+        default={"nested": {"key": "value"}}
+    )
+
+
+class TestBinarySnapshot(TestBase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = Path(self._directory.name, "config.bin")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_round_trip(self):
+        root = {
+            "scalars": {
+                "none": None,
+                "true": True,
+                "false": False,
+                "int": -42,
+                "big_int": 2 ** 70,
+                "float": 1.5,
+                "str": "välue",
+            },
+            "time": {
+                "datetime": datetime(2008, 9, 3, 20, 56, 35, 450686, tzinfo=timezone.utc),
+                "date": date(2008, 9, 3),
+                "timedelta": timedelta(days=1, seconds=2, microseconds=3),
+            },
+            "list": [1, "two", {"three": [3]}],
+        }
+        write_binary_snapshot(root, self.path)
+
+        reader = BinarySnapshotReader(self.path)
+        self.assertEqual(root, reader.get(()))
+        self.assertEqual(root["scalars"], reader.get(["scalars"]))
+        self.assertEqual(2 ** 70, reader.get(["scalars", "big_int"]))
+        self.assertEqual(root["time"]["datetime"], reader.get(["time", "datetime"]))
+        # like any other data source, None values are not provided
+        self.assertIs(MISSING, reader.get(["scalars", "none"]))
+        self.assertIs(MISSING, reader.get(["scalars", "missing"]))
+        reader.close()
+
+    def test_unsupported_type(self):
+        self.assertRaises(ValueError, lambda: write_binary_snapshot({"key": object()}, self.path))
+
+    def test_convert_source(self):
+        convert_source(JsonSource("test", ["./", "./tests"]), self.path)
+
+        source = BinarySnapshotSource("config", self._directory.name)
+        config = BinaryConfig(data_sources=[source], singleton=False)
+
+        self.assertEqual("value", config.STRING.value)
+        self.assertEqual(2, config.INT.value)
+
+    def test_convert_config(self):
+        config = BinaryConfig(data_sources=[], singleton=False)
+        convert_config(config, self.path)
+
+        restored = BinaryConfig(data_sources=[BinarySnapshotSource("config", self._directory.name)],
+                                singleton=False)
+        for name, entry in config._config_entries.items():
+            self.assertEqual(entry.value, restored._config_entries[name].value)
@@ -18,11 +18,30 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+from typing import Dict
+
 from container_app_conf.entry.string import StringConfigEntry
+from container_app_conf.source import DataSource
 from container_app_conf.source.yaml_source import YamlSource
 from tests import TestBase
 
 
+class DuplicateKeyDataSource(DataSource):
+
+    def _load(self) -> Dict:
+        return {
+            "Test": {
+                "Key": "value",
+                "Duplicate": "a",
+                "duplicate": "b",
+            },
+            "other": {
+                "Duplicate": "a",
+                "DUPLICATE": "b",
+            }
+        }
+
+
 class TestIgnoreCase(TestBase):
 
     def test_ignore_case(self):
@@ -46,3 +65,17 @@ class TestIgnoreCase(TestBase):
         self.assertEqual(source.get(str_entry2), "value")
         self.assertTrue(source.has(str_entry3))
         self.assertEqual(source.get(str_entry3), "?")
+
+    def test_duplicate_keys(self):
+        key_entry = StringConfigEntry(
+            key_path=["test", "KEY"],
+        )
+        duplicate_entry = StringConfigEntry(
+            key_path=["test", "duplicate"],
+        )
+        source = DuplicateKeyDataSource(ignore_case_in_keys=True)
+        source.load()
+
+        # duplicates are only detected along the looked up key paths
+        self.assertEqual("value", source.get(key_entry))
+        self.assertRaises(ValueError, lambda: source.get(duplicate_entry))
@@ -0,0 +1,103 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import gc
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+from container_app_conf import ConfigBase
+from container_app_conf.entry.string import StringConfigEntry
+from container_app_conf.source.json_source import JsonSource
+from container_app_conf.source.shared_cache import SHARED_SOURCE_CACHE
+from tests import TestBase
+
+
+class CountingJsonSource(JsonSource):
+    load_count = 0
+
+    def _load_file(self, file_path: str) -> Dict:
+        CountingJsonSource.load_count += 1
+        return super()._load_file(file_path)
+
+
+class SharedConfig1(ConfigBase):
+    STRING = StringConfigEntry(
+        key_path=["testing", "key1"],
+        default="default"
+    )
+
+
+class SharedConfig2(ConfigBase):
+    STRING = StringConfigEntry(
+        key_path=["testing", "key1"],
+        default="default"
+    )
+
+
+class TestSharedSourceCache(TestBase):
+
+    def setUp(self):
+        CountingJsonSource.load_count = 0
+        self._directory = tempfile.TemporaryDirectory()
+        self.file = Path(self._directory.name, "shared.json")
+        self._write('{"testing": {"key1": "shared"}}', 1)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _write(self, content: str, mtime: int):
+        self.file.write_text(content)
+        # pretend the file has not been modified for a while
+        os.utime(self.file, ns=(mtime, mtime))
+
+    def _source(self) -> JsonSource:
+        return CountingJsonSource("shared", self._directory.name, shared=True)
+
+    def test_single_parse(self):
+        config1 = SharedConfig1(data_sources=[self._source()], singleton=False)
+        config2 = SharedConfig2(data_sources=[self._source()], singleton=False)
+        config3 = SharedConfig2(data_sources=[self._source()], singleton=False)
+
+        self.assertEqual(1, CountingJsonSource.load_count)
+        self.assertEqual("shared", config1.STRING.value)
+        self.assertEqual("shared", config2.STRING.value)
+        self.assertIs(config2.data_sources[0].root, config3.data_sources[0].root)
+
+    def test_invalidation(self):
+        config = SharedConfig1(data_sources=[self._source()], singleton=False)
+        self._write('{"testing": {"key1": "changed"}}', 2)
+        config.reload()
+
+        self.assertEqual(2, CountingJsonSource.load_count)
+        self.assertEqual("changed", config.STRING.value)
+
+    def test_reference_counting(self):
+        sources = [self._source(), self._source()]
+        for source in sources:
+            source.load()
+        size = len(SHARED_SOURCE_CACHE)
+
+        sources[0].release()
+        self.assertEqual(size, len(SHARED_SOURCE_CACHE))
+
+        del sources[1]
+        gc.collect()
+        self.assertEqual(size - 1, len(SHARED_SOURCE_CACHE))
@@ -18,17 +18,23 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 import os
-from typing import Dict
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any
 from unittest import mock
 
-from container_app_conf import ConfigEntry
+from container_app_conf import ConfigBase, ConfigEntry, DataSource
+from container_app_conf.const import RETAIN_DECLARED, RETAIN_NONE
 from container_app_conf.entry.int import IntConfigEntry
 from container_app_conf.entry.string import StringConfigEntry
+from container_app_conf.source import MISSING
 from container_app_conf.source.env_source import EnvSource
 from container_app_conf.source.json_source import JsonSource
 from container_app_conf.source.toml_source import TomlSource
 from container_app_conf.source.yaml_source import YamlSource
-from tests import TestBase
+from tests import TestBase, TestConfigBase
 from tests.data_source import MemoryDataSource
 from tests.singleton_test import TestConfigBase2
 
@@ -49,6 +55,77 @@ class MemoryDataSource2(MemoryDataSource):
         }
 
 
+class UnusedDataSource(MemoryDataSource):
+
+    def items(self) -> Dict[ConfigEntry, any]:
+        raise AssertionError("Source should not have been loaded")
+
+
+class ThreadRecordingDataSource(MemoryDataSource):
+
+    def __init__(self, value: bool):
+        super().__init__()
+        self.value = value
+        self.load_thread = None
+
+    def items(self) -> Dict[ConfigEntry, any]:
+        self.load_thread = threading.current_thread()
+        return {
+            TestConfigBase2.BOOL: self.value
+        }
+
+
+class SharedDataSource(MemoryDataSource):
+
+    def _load(self) -> Dict:
+        return {
+            "test": {
+                "bool": True,
+                "other": "value"
+            },
+            "other_service": {
+                "routes": ["a", "b"]
+            }
+        }
+
+
+class AccessorDataSource(DataSource):
+    """
+    Data source implementing has() and get() instead of lookup()
+    """
+
+    def _load(self) -> Dict:
+        return {}
+
+    def has(self, entry: ConfigEntry) -> bool:
+        return entry.key_path == ["test", "bool"]
+
+    def get(self, entry: ConfigEntry) -> Any:
+        return "custom"
+
+
+class CustomEnvSource(EnvSource):
+
+    @staticmethod
+    def env_key(entry: ConfigEntry) -> str:
+        return "CUSTOM_" + EnvSource.env_key(entry)
+
+
+class CountingConfigEntry(StringConfigEntry):
+    parse_count = 0
+
+    def _value_to_type(self, value):
+        CountingConfigEntry.parse_count += 1
+        return super()._value_to_type(value)
+
+
+class CountingConfig(ConfigBase):
+    COUNTING = CountingConfigEntry(
+        key_path=["test", "bool"],
+        default="default"
+    )
+
+
 class TestDataSource(TestBase):
 
     def test_priority(self):
@@ -66,6 +143,99 @@ class TestDataSource(TestBase):
 
         self.assertFalse(conf2.BOOL.value)
 
+    def test_single_parse_per_entry(self):
+        CountingConfigEntry.parse_count = 0
+        conf = CountingConfig(data_sources=[
+            MemoryDataSource1(),
+            MemoryDataSource2()
+        ], singleton=False)
+
+        self.assertEqual(conf.COUNTING.value, "True")
+        self.assertEqual(CountingConfigEntry.parse_count, 1)
+
+    def test_skip_lower_priority_sources(self):
+        conf = TestConfigBase2(data_sources=[
+            MemoryDataSource1(),
+            UnusedDataSource()
+        ], singleton=False)
+
+        self.assertTrue(conf.BOOL.value)
+
+    def test_parallel_loading(self):
+        data_sources = [
+            ThreadRecordingDataSource(False),
+            ThreadRecordingDataSource(True)
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            conf = TestConfigBase2(data_sources=data_sources, singleton=False, executor=executor)
+
+        # priority is still given by the order of data sources
+        self.assertFalse(conf.BOOL.value)
+        for source in data_sources:
+            self.assertIsNotNone(source.load_thread)
+            self.assertIsNot(threading.current_thread(), source.load_thread)
+            source.load_thread = None
+
+        # reloads don't use the (shut down) executor and stop loading once all entries are resolved
+        conf.reload()
+        self.assertFalse(conf.BOOL.value)
+        self.assertIs(threading.current_thread(), data_sources[0].load_thread)
+        self.assertIsNone(data_sources[1].load_thread)
+
+    def test_retain_declared(self):
+        source = SharedDataSource()
+        conf = TestConfigBase2(data_sources=[source], singleton=False, retain_source_data=RETAIN_DECLARED)
+
+        self.assertTrue(conf.BOOL.value)
+        self.assertEqual({"test": {"bool": True}}, source.root)
+        self.assertTrue(source.get(TestConfigBase2.BOOL))
+
+    def test_retain_none(self):
+        source = SharedDataSource()
+        conf = TestConfigBase2(data_sources=[source], singleton=False, retain_source_data=RETAIN_NONE)
+
+        self.assertTrue(conf.BOOL.value)
+        self.assertEqual({}, source.root)
+
+        conf.reload()
+        self.assertTrue(conf.BOOL.value)
+        self.assertEqual({}, source.root)
+
+    def test_retain_invalid(self):
+        self.assertRaises(ValueError, lambda: TestConfigBase2(data_sources=[SharedDataSource()], singleton=False,
+                                                              retain_source_data="some"))
+
+    def test_custom_accessors(self):
+        conf = CountingConfig(data_sources=[AccessorDataSource(), MemoryDataSource1()], singleton=False)
+
+        self.assertEqual("custom", conf.COUNTING.value)
+        self.assertIs(MISSING, AccessorDataSource().lookup(StringConfigEntry(key_path=["other"])))
+
+    def test_lookup(self):
+        deep_entry = StringConfigEntry(
+            key_path=["test", "this", "is", "deep"],
+        )
+        parent_entry = StringConfigEntry(
+            key_path=["test", "this", "is"],
+        )
+        missing_entry = StringConfigEntry(
+            key_path=["test", "this", "is", "missing"],
+        )
+
+        class DeepDataSource(MemoryDataSource):
+            def items(self) -> Dict[ConfigEntry, any]:
+                return {
+                    deep_entry: "value"
+                }
+
+        source = DeepDataSource()
+        source.load()
+
+        self.assertEqual("value", source.lookup(deep_entry))
+        self.assertEqual({"deep": "value"}, source.lookup(parent_entry))
+        self.assertIs(MISSING, source.lookup(missing_entry))
+        self.assertFalse(source.has(missing_entry))
+
     def test_toml(self):
         str_entry = StringConfigEntry(
             key_path=["testing", "key1"],
@@ -98,6 +268,17 @@ class TestDataSource(TestBase):
         self.assertTrue(source.has(int_entry))
         self.assertEqual(source.get(int_entry), 2)
 
+    def test_yaml_safe(self):
+        str_entry = StringConfigEntry(
+            key_path=["testing", "key1"],
+            default="value"
+        )
+        for pure in [False, True]:
+            source = YamlSource("test", ["./", "./tests"], typ="safe", pure=pure)
+            source.load()
+            self.assertIs(dict, type(source.root))
+            self.assertEqual(source.get(str_entry), "value")
+
     def test_json(self):
         str_entry = StringConfigEntry(
             key_path=["testing", "key1"],
@@ -114,6 +295,28 @@ class TestDataSource(TestBase):
         self.assertTrue(source.has(int_entry))
         self.assertEqual(source.get(int_entry), 2)
 
+    def test_file_discovery(self):
+        with tempfile.TemporaryDirectory() as low_priority, tempfile.TemporaryDirectory() as high_priority:
+            Path(low_priority, "test.json").write_text('{}')
+            Path(high_priority, "other.json").write_text('{}')
+            # pretend the directories have not been modified for a while
+            for directory in [low_priority, high_priority]:
+                os.utime(directory, ns=(0, 0))
+
+            source = JsonSource("test", [high_priority, low_priority])
+            self.assertIsNone(source.file_path)
+            self.assertEqual(os.path.join(low_priority, "test.json"), source._find_config_file())
+            self.assertEqual(os.path.join(low_priority, "test.json"), source.file_path)
+            self.assertIsNotNone(source.discovery_time)
+
+            # unmodified directories are not scanned again
+            with mock.patch("os.scandir", side_effect=AssertionError("directory scanned")):
+                self.assertEqual(os.path.join(low_priority, "test.json"), source._find_config_file())
+
+            Path(high_priority, "test.json").write_text('{}')
+            os.utime(high_priority, ns=(1, 1))
+            self.assertEqual(os.path.join(high_priority, "test.json"), source._find_config_file())
+
     def test_env(self):
         str_entry = StringConfigEntry(
             key_path=["test-ing", "key1"],
@@ -142,3 +345,64 @@ class TestDataSource(TestBase):
         self.assertTrue(source.has(str_entry))
         self.assertEqual(source.get(str_entry), expected + '2')
         self.assertFalse(source.has(int_entry))
+
+    def test_env_unchanged_reload(self):
+        CountingConfigEntry.parse_count = 0
+        source = EnvSource()
+        with mock.patch.dict(os.environ, {"TEST_BOOL": "env"}, clear=True):
+            conf = CountingConfig(data_sources=[source], singleton=False)
+            self.assertFalse(source.has_changed())
+
+            with mock.patch.object(source, "load", wraps=source.load) as load:
+                conf.reload()
+                load.assert_not_called()
+            self.assertEqual(1, CountingConfigEntry.parse_count)
+
+            os.environ["TEST_BOOL"] = "changed"
+            self.assertTrue(source.has_changed())
+            conf.reload()
+
+        self.assertEqual("changed", conf.COUNTING.value)
+        self.assertEqual(2, CountingConfigEntry.parse_count)
+
+    def test_env_failed_reload(self):
+        source = EnvSource()
+        with mock.patch.dict(os.environ, {"TEST_INT": "1"}, clear=True):
+            conf = TestConfigBase(data_sources=[source], singleton=False)
+
+            os.environ["TEST_INT"] = "invalid"
+            self.assertRaises(ValueError, conf.reload)
+            # the environment is unchanged since the failed reload, but its values have never been resolved
+            self.assertRaises(ValueError, conf.reload)
+            self.assertEqual(1, conf.INT.value)
+
+            os.environ["TEST_INT"] = "2"
+            conf.reload()
+
+        self.assertEqual(2, conf.INT.value)
+
+    def test_env_custom_key(self):
+        source = CustomEnvSource()
+        with mock.patch.dict(os.environ, {"CUSTOM_TEST_BOOL": "custom", "TEST_BOOL": "default"}, clear=True):
+            conf = CountingConfig(data_sources=[source], singleton=False)
+
+        self.assertEqual("custom", conf.COUNTING.value)
+        self.assertEqual("custom", source.get(CountingConfig.COUNTING))
+
+    def test_env_prefix(self):
+        str_entry = StringConfigEntry(
+            key_path=["testing", "key1"],
+            default="value"
+        )
+
+        source = EnvSource(prefix="MYAPP_")
+        environment = {
+            "MYAPP_TESTING_KEY1": "expected",
+            "TESTING_KEY1": "unprefixed",
+            "OTHER_SERVICE_PORT": "tcp://10.0.0.1:80",
+        }
+        with mock.patch.dict(os.environ, environment, clear=True):
+            source.load()
+
+        self.assertEqual({"TESTING_KEY1": "expected"}, source.root)
+        self.assertEqual("expected", source.get(str_entry))
@@ -0,0 +1,55 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import tempfile
+import timeit
+from pathlib import Path
+
+from container_app_conf.source.yaml_source import YamlSource
+from tests import TestBase, benchmark
+
+ROUTE_COUNT = 150
+
+
+class TestYamlLoaderBenchmark(TestBase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        routes = "".join(map(
+            lambda x: "  route{0}:\n    host: host{0}.example.com\n    port: {0}\n    tags: [a, b, c]\n".format(x),
+            range(ROUTE_COUNT)))
+        Path(self._directory.name, "routes.yaml").write_text("# routing table\nroutes:\n" + routes)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _load_time(self, typ: str) -> float:
+        """
+        :param typ: the loader to use
+        :return: best time (in seconds) of loading the routing table
+        """
+        source = YamlSource("routes", self._directory.name, typ=typ)
+        return min(timeit.repeat(source.load, number=1, repeat=3))
+
+    @benchmark
+    def test_safe_loader_is_faster(self):
+        round_trip = self._load_time("rt")
+        safe = self._load_time("safe")
+
+        self.assertLess(safe, round_trip)
@@ -132,6 +132,42 @@ class EntryTest(EntryTestBase):
 
         self.assert_input_output(config_entry, input_output)
 
+    def test_date_entry_formats(self):
+        from datetime import datetime, date
+
+        config_entry = DateConfigEntry(key_path=["date"], formats=["%d.%m.%Y %H:%M", "%d.%m.%Y"])
+        input_output = [
+            ("2008-09-03 20:56", datetime(2008, 9, 3, 20, 56)),
+            ("03.09.2008 20:56", datetime(2008, 9, 3, 20, 56)),
+            ("03.09.2008", datetime(2008, 9, 3)),
+            (date(2008, 9, 3), datetime(2008, 9, 3)),
+            ("Sep 3 2008", ValueError),
+        ]
+
+        self.assert_input_output(config_entry, input_output)
+
+    def test_date_entry_dateutil_fallback(self):
+        from datetime import datetime
+
+        config_entry = DateConfigEntry(key_path=["date"], dateutil_fallback=True)
+        input_output = [
+            ("Sep 3 2008", datetime(2008, 9, 3)),
+        ]
+
+        self.assert_input_output(config_entry, input_output)
+
+    def test_date_entry_dateutil_fallback_not_cached(self):
+        from datetime import datetime
+        from unittest import mock
+
+        config_entry = DateConfigEntry(key_path=["date"], dateutil_fallback=True)
+        today = datetime(2008, 9, 3, 20, 56)
+        tomorrow = datetime(2008, 9, 4, 20, 56)
+        with mock.patch("dateutil.parser.parse", side_effect=[today, tomorrow]):
+            self.assertEqual(today, config_entry._parse_value("20:56"))
+            # relative to the current date, so the value has to be parsed again
+            self.assertEqual(tomorrow, config_entry._parse_value("20:56"))
+
     def test_timedelta_entry(self):
         from datetime import timedelta
 
@@ -142,6 +178,25 @@ class EntryTest(EntryTestBase):
             ("4h0m3s", timedelta(hours=4, minutes=0, seconds=3)),
             ("4h3s", timedelta(hours=4, minutes=0, seconds=3)),
             ("4:13", timedelta(hours=0, minutes=4, seconds=13)),
+            (":22", timedelta(seconds=22)),
+            ("2:04:13:02.266", timedelta(days=2, hours=4, minutes=13, seconds=2.266)),
+            ("2-04:13:02", timedelta(days=2, hours=4, minutes=13, seconds=2)),
+            ("2 days, 4:13:02", timedelta(days=2, hours=4, minutes=13, seconds=2)),
+            ("1w 2d 4:13:02", timedelta(weeks=1, days=2, hours=4, minutes=13, seconds=2)),
+            ("1h 4:13", ValueError),
+            ("90", timedelta(seconds=90)),
+            (90, timedelta(seconds=90)),
+            (1.5, timedelta(seconds=1.5)),
+            ("250ms", timedelta(milliseconds=250)),
+            ("1 hour, 30 minutes", timedelta(hours=1, minutes=30)),
+            ("2w 3d", timedelta(weeks=2, days=3)),
+            ("-5m", timedelta(minutes=-5)),
+            ("PT1H30M", timedelta(hours=1, minutes=30)),
+            ("P1DT2H", timedelta(days=1, hours=2)),
+            ("P2W", timedelta(weeks=2)),
+            ("PT", ValueError),
+            ("1x", ValueError),
+            (True, ValueError),
         ]
 
         self.assert_input_output(config_entry, input_output)
@@ -206,3 +261,48 @@ class EntryTest(EntryTestBase):
         ]
 
         self.assert_input_output(config_entry, input_output)
+
+    def test_parse_cache(self):
+        from datetime import timedelta
+
+        TimeDeltaConfigEntry.parse_cache.clear()
+        config_entry = TimeDeltaConfigEntry(key_path=["timedelta"])
+        other_entry = TimeDeltaConfigEntry(key_path=["other"])
+
+        self.assertEqual(timedelta(minutes=32), config_entry._parse_value("32m"))
+        self.assertEqual(timedelta(minutes=32), other_entry._parse_value("32m"))
+
+        stats = TimeDeltaConfigEntry.parse_cache.stats()
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(1, stats.size)
+
+    def test_parse_cache_parameters(self):
+        import re
+
+        case_sensitive = RegexConfigEntry(key_path=["regex"])
+        case_insensitive = RegexConfigEntry(key_path=["regex"], flags=re.IGNORECASE)
+
+        self.assertEqual(0, case_sensitive._parse_value("^a$").flags & re.IGNORECASE)
+        self.assertNotEqual(0, case_insensitive._parse_value("^a$").flags & re.IGNORECASE)
+
+    def test_parse_cache_copies_mutable_values(self):
+        config_entry = DictConfigEntry(key_path=["dict"])
+
+        value = config_entry._parse_value("{'key': 'value'}")
+        value["key"] = "modified"
+
+        self.assertEqual({"key": "value"}, config_entry._parse_value("{'key': 'value'}"))
+
+    def test_parse_cache_eviction(self):
+        from container_app_conf.entry.parse_cache import ParseCache, NOT_CACHED
+
+        cache = ParseCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        # "b" is the least recently used value afterwards
+        self.assertEqual(1, cache.get("a"))
+        cache.put("c", 3)
+
+        self.assertIs(NOT_CACHED, cache.get("b"))
+        self.assertEqual(2, cache.stats().size)
@@ -0,0 +1,74 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import subprocess
+import sys
+
+from tests import TestBase, PROJECT_ROOT, benchmark
+
+# upper bound for the cumulative import time of the package in microseconds
+IMPORT_TIME_BUDGET = 200_000
+
+HEAVY_DEPENDENCIES = [
+    "ruamel.yaml",
+    "toml",
+    "dateutil",
+    "pytimeparse",
+    "voluptuous",
+    "py_range_parse",
+]
+
+
+class TestImportTime(TestBase):
+
+    @staticmethod
+    def _import_times(statement: str) -> dict:
+        """
+        Imports modules in a fresh interpreter
+        :param statement: import statement to run
+        :return: map of (module name -> cumulative import time in microseconds)
+        """
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                                cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if not cumulative.strip().isdigit():
+                continue
+            times[name.strip()] = int(cumulative)
+        return times
+
+    def test_no_heavy_imports(self):
+        times = self._import_times(
+            "import container_app_conf;"
+            "import container_app_conf.entry.date, container_app_conf.entry.dict,"
+            " container_app_conf.entry.int, container_app_conf.entry.range,"
+            " container_app_conf.entry.timedelta, container_app_conf.source.yaml_source,"
+            " container_app_conf.source.toml_source, container_app_conf.util"
+        )
+
+        for dependency in HEAVY_DEPENDENCIES:
+            self.assertNotIn(dependency, times)
+
+    @benchmark
+    def test_import_time_budget(self):
+        times = self._import_times("import container_app_conf")
+        self.assertLess(times["container_app_conf"], IMPORT_TIME_BUDGET)
@@ -0,0 +1,69 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+from container_app_conf import ConfigBase
+from container_app_conf.entry.int import IntConfigEntry
+from container_app_conf.entry.string import StringConfigEntry
+from tests import TestBase
+from tests.data_source.source_test import CountingConfigEntry, MemoryDataSource1
+
+
+class LazyConfig(ConfigBase, lazy=True):
+    COUNTING = CountingConfigEntry(
+        key_path=["test", "bool"],
+        default="default"
+    )
+    INVALID_DEFAULT = IntConfigEntry(
+        key_path=["test", "int"],
+        default="not a number"
+    )
+    REQUIRED = StringConfigEntry(
+        key_path=["test", "required"],
+        required=True
+    )
+
+
+class TestLazy(TestBase):
+
+    def test_parse_on_first_access(self):
+        CountingConfigEntry.parse_count = 0
+        conf = LazyConfig(data_sources=[MemoryDataSource1()], singleton=False)
+        self.assertEqual(0, CountingConfigEntry.parse_count)
+
+        self.assertEqual("True", conf.COUNTING.value)
+        self.assertEqual("True", conf.COUNTING.value)
+        self.assertEqual(1, CountingConfigEntry.parse_count)
+
+    def test_invalid_values_raise_on_access(self):
+        conf = LazyConfig(data_sources=[], singleton=False)
+
+        with self.assertRaises(ValueError):
+            conf.INVALID_DEFAULT.value
+        with self.assertRaises(ValueError):
+            conf.REQUIRED.value
+
+    def test_validate(self):
+        conf = LazyConfig(data_sources=[], singleton=False)
+        with self.assertRaises(ValueError):
+            conf.validate()
+
+        conf.INVALID_DEFAULT.value = 5
+        conf.REQUIRED.value = "value"
+        conf.validate()
+        self.assertEqual(5, conf.INVALID_DEFAULT.value)
@@ -0,0 +1,120 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from container_app_conf import ConfigBase
+from container_app_conf.entry.date import DateConfigEntry
+from container_app_conf.entry.int import IntConfigEntry
+from container_app_conf.entry.string import StringConfigEntry
+from container_app_conf.shared_snapshot import SharedSnapshot
+from container_app_conf.source.json_source import JsonSource
+from tests import TestBase, PROJECT_ROOT
+
+
+class SharedSnapshotConfig(ConfigBase):
+    STRING = StringConfigEntry(
+        key_path=["testing", "key1"],
+        default="default"
+    )
+    INT = IntConfigEntry(
+        key_path=["testing", "key2"],
+        default=1
+    )
+    # differs in every process
+    DATE = DateConfigEntry(
+        key_path=["testing", "date"],
+        default=datetime.now()
+    )
+
+
+class OtherSnapshotConfig(ConfigBase):
+    STRING = StringConfigEntry(
+        key_path=["testing", "key1"],
+        default="default"
+    )
+
+
+class TestSharedSnapshot(TestBase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.json_file = Path(self._directory.name, "shared.json")
+        self.json_file.write_text('{"testing": {"key1": "parent", "key2": 2}}')
+        self.parent = SharedSnapshotConfig(data_sources=[JsonSource("shared", self._directory.name)],
+                                           singleton=False)
+        self.shared_snapshot = SharedSnapshot(Path(self._directory.name, "config.snapshot"))
+
+    def tearDown(self):
+        self.shared_snapshot.close()
+        self._directory.cleanup()
+
+    def test_attach(self):
+        self.assertEqual(1, self.shared_snapshot.publish(self.parent))
+
+        worker = SharedSnapshotConfig.attach(SharedSnapshot(self.shared_snapshot.path), singleton=False)
+
+        self.assertEqual([], worker.data_sources)
+        self.assertEqual("parent", worker.STRING.value)
+        self.assertEqual(2, worker.INT.value)
+
+    def test_reload(self):
+        self.shared_snapshot.publish(self.parent)
+        worker = SharedSnapshotConfig.attach(SharedSnapshot(self.shared_snapshot.path), singleton=False)
+        changes = []
+        worker.add_change_listener(changes.append)
+
+        # nothing has been published in the meantime
+        worker.reload()
+        self.assertEqual([], changes)
+
+        self.json_file.write_text('{"testing": {"key1": "reloaded", "key2": 2}}')
+        self.parent.reload()
+        self.assertEqual(2, self.shared_snapshot.publish(self.parent))
+        worker.reload()
+
+        self.assertEqual("reloaded", worker.STRING.value)
+        self.assertEqual(1, len(changes))
+        self.assertEqual("parent", changes[0].old_value)
+        # outdated data files are removed eventually
+        self.shared_snapshot.publish(self.parent)
+        self.assertFalse(self.shared_snapshot._data_path(1).exists())
+
+    def test_not_published(self):
+        self.assertRaises(ValueError, lambda: SharedSnapshotConfig.attach(self.shared_snapshot, singleton=False))
+
+    def test_schema_mismatch(self):
+        self.shared_snapshot.publish(self.parent)
+        self.assertRaises(ValueError, lambda: OtherSnapshotConfig.attach(self.shared_snapshot, singleton=False))
+
+    def test_other_process(self):
+        self.shared_snapshot.publish(self.parent)
+
+        result = subprocess.run([sys.executable, "-c", "\n".join([
+            "from container_app_conf.shared_snapshot import SharedSnapshot",
+            "from tests.shared_snapshot_test import SharedSnapshotConfig",
+            "config = SharedSnapshotConfig.attach(SharedSnapshot({!r}))".format(str(self.shared_snapshot.path)),
+            "print(config.STRING.value)",
+        ])], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+
+        self.assertEqual("parent", result.stdout.strip())
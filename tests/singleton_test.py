@@ -17,9 +17,14 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
-from container_app_conf import ConfigBase
+import threading
+from typing import Dict
+
+from container_app_conf import ConfigBase, ConfigEntry
 from container_app_conf.entry.bool import BoolConfigEntry
+from container_app_conf.entry.int import IntConfigEntry
 from tests import TestBase, TestConfigBase
+from tests.data_source import MemoryDataSource
 
 
 class TestConfigBase2(ConfigBase):
@@ -30,6 +35,34 @@ class TestConfigBase2(ConfigBase):
     )
 
 
+class TestConfigBaseReload(ConfigBase):
+    BOOL = BoolConfigEntry(
+        key_path=["test", "bool"],
+        default=False
+    )
+
+
+class TestConfigBaseDeclarations(ConfigBase):
+    INT = IntConfigEntry(
+        key_path=["test", "int"],
+        default="5"
+    )
+
+
+class CountingDataSource(MemoryDataSource):
+
+    def __init__(self):
+        super().__init__()
+        self.value = True
+        self.load_count = 0
+
+    def items(self) -> Dict[ConfigEntry, any]:
+        self.load_count += 1
+        return {
+            TestConfigBaseReload.BOOL: self.value
+        }
+
+
 class TestSingleton(TestBase):
 
     def test_singleton(self):
@@ -58,3 +91,60 @@ class TestSingleton(TestBase):
         self.assertNotEqual(conf1.INT.value, conf2.INT.value)
         self.assertNotEqual(conf1.INT.value, conf3.INT.value)
         self.assertNotEqual(conf2.INT.value, conf3.INT.value)
+
+    def test_instance_shares_declarations(self):
+        conf1 = TestConfigBase(singleton=False)
+        conf2 = TestConfigBase(singleton=False)
+
+        conf1.STRING.value = "changed"
+
+        self.assertIs(conf1.STRING._entry, conf2.STRING._entry)
+        self.assertIs(TestConfigBase.STRING, conf1.STRING._entry)
+        self.assertEqual("default value", conf2.STRING.value)
+        self.assertEqual(TestConfigBase.STRING.key_path, conf1.STRING.key_path)
+
+    def test_singleton_uses_declarations(self):
+        conf = TestConfigBaseDeclarations()
+
+        self.assertIs(TestConfigBaseDeclarations.INT, conf.INT)
+        self.assertIsInstance(conf.INT, ConfigEntry)
+        self.assertEqual(5, TestConfigBaseDeclarations.INT.value)
+
+        conf.INT.secret = True
+        self.assertTrue(TestConfigBaseDeclarations.INT.secret)
+
+        TestConfigBaseDeclarations.INT.value = "7"
+        self.assertEqual(7, conf.INT.value)
+        self.assertEqual(7, conf.snapshot()[conf.INT])
+
+        # non-singleton instances don't affect the declarations
+        other = TestConfigBaseDeclarations(singleton=False)
+        other.INT.value = 8
+        self.assertEqual(7, TestConfigBaseDeclarations.INT.value)
+
+    def test_singleton_is_loaded_once(self):
+        source = CountingDataSource()
+
+        instances = []
+
+        def create():
+            instances.append(TestConfigBaseReload(data_sources=[source]))
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, source.load_count)
+        for instance in instances:
+            self.assertIs(instances[0], instance)
+        self.assertIs(instances[0], TestConfigBaseReload())
+        self.assertEqual(1, source.load_count)
+
+        conf = TestConfigBaseReload()
+        self.assertTrue(conf.BOOL.value)
+        source.value = False
+        conf.reload()
+        self.assertEqual(2, source.load_count)
+        self.assertFalse(conf.BOOL.value)
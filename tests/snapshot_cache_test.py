@@ -0,0 +1,134 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+from voluptuous import Schema
+
+from container_app_conf import ConfigBase
+from container_app_conf.cache import SnapshotCache
+from container_app_conf.entry.dict import DictConfigEntry
+from container_app_conf.entry.int import IntConfigEntry
+from container_app_conf.entry.regex import RegexConfigEntry
+from container_app_conf.entry.string import StringConfigEntry
+from container_app_conf.source.json_source import JsonSource
+from tests import TestBase
+
+
+class CachedConfig(ConfigBase):
+    STRING = StringConfigEntry(
+        key_path=["testing", "key1"],
+        default="default"
+    )
+    INT = IntConfigEntry(
+        key_path=["testing", "key2"],
+        default=1
+    )
+
+
+class RegexCachedConfig(ConfigBase):
+    REGEX = RegexConfigEntry(
+        key_path=["testing", "regex"],
+        default="^[a-z]+$"
+    )
+    DICT = DictConfigEntry(
+        key_path=["testing", "dict"],
+        schema=Schema({str: lambda x: x})
+    )
+
+
+class CountingJsonSource(JsonSource):
+    load_count = 0
+
+    def _load_file(self, file_path: str) -> Dict:
+        CountingJsonSource.load_count += 1
+        return super()._load_file(file_path)
+
+
+class TestSnapshotCache(TestBase):
+
+    def test_snapshot_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = Path(directory, "cached.json")
+            config_file.write_text('{"testing": {"key1": "value", "key2": 2}}')
+            cache = SnapshotCache(Path(directory, "cache", "snapshot.bin"))
+
+            def create():
+                return CachedConfig(data_sources=[CountingJsonSource("cached", directory)],
+                                    singleton=False, snapshot_cache=cache)
+
+            CountingJsonSource.load_count = 0
+            conf = create()
+            self.assertEqual(1, CountingJsonSource.load_count)
+            self.assertTrue(cache.path.is_file())
+
+            conf = create()
+            self.assertEqual(1, CountingJsonSource.load_count)
+            self.assertEqual("value", conf.STRING.value)
+            self.assertEqual(2, conf.INT.value)
+
+            config_file.write_text('{"testing": {"key1": "changed"}}')
+            conf = create()
+            self.assertEqual(2, CountingJsonSource.load_count)
+            self.assertEqual("changed", conf.STRING.value)
+            self.assertEqual(1, conf.INT.value)
+
+    def test_unvalidated_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # key1 is missing and has no default
+            Path(directory, "cached.json").write_text('{"testing": {"key2": 2}}')
+            cache = SnapshotCache(Path(directory, "snapshot.bin"))
+
+            class RequiredConfig(ConfigBase):
+                STRING = StringConfigEntry(key_path=["testing", "key1"], required=True)
+
+            def create(validate: bool):
+                return RequiredConfig(data_sources=[JsonSource("cached", directory)],
+                                      validate=validate, singleton=False, snapshot_cache=cache)
+
+            create(validate=False)
+            self.assertTrue(cache.path.is_file())
+            # the snapshot of the unvalidated load must not skip validation
+            self.assertRaises(ValueError, create, True)
+
+    def test_unsupported_source(self):
+        from tests.data_source.source_test import MemoryDataSource1
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SnapshotCache(os.path.join(directory, "snapshot.bin"))
+            CachedConfig(data_sources=[MemoryDataSource1()], singleton=False, snapshot_cache=cache)
+            self.assertFalse(cache.path.exists())
+
+    def test_parse_parameters_fingerprint(self):
+        conf = RegexCachedConfig(data_sources=[], singleton=False)
+        fingerprint = SnapshotCache._schema_fingerprint(conf)
+        # addresses of validator functions are not part of the fingerprint
+        self.assertNotIn(" at 0x", fingerprint)
+
+        flags = RegexCachedConfig.REGEX.flags
+        try:
+            RegexCachedConfig.REGEX.flags = re.IGNORECASE
+            self.assertNotEqual(fingerprint, SnapshotCache._schema_fingerprint(conf))
+        finally:
+            RegexCachedConfig.REGEX.flags = flags
+        self.assertEqual(fingerprint, SnapshotCache._schema_fingerprint(conf))
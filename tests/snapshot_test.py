@@ -0,0 +1,140 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import threading
+from typing import Dict
+
+from container_app_conf import ConfigBase, ConfigEntry
+from container_app_conf.entry.int import IntConfigEntry
+from tests import TestBase
+from tests.data_source import MemoryDataSource
+
+
+class PairConfig(ConfigBase):
+    FIRST = IntConfigEntry(
+        key_path=["pair", "first"],
+        default=0
+    )
+    SECOND = IntConfigEntry(
+        key_path=["pair", "second"],
+        default=0
+    )
+
+
+class ParentConfig(ConfigBase):
+    SHARED = IntConfigEntry(
+        key_path=["parent", "shared"],
+        default=1
+    )
+
+
+class ChildConfig(ParentConfig):
+    CHILD = IntConfigEntry(
+        key_path=["child", "value"],
+        default=2
+    )
+
+
+class PairDataSource(MemoryDataSource):
+
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+        self.invalid = False
+
+    def items(self) -> Dict[ConfigEntry, any]:
+        self.counter += 1
+        return {
+            PairConfig.FIRST: self.counter,
+            PairConfig.SECOND: "invalid" if self.invalid else self.counter,
+        }
+
+
+class TestSnapshot(TestBase):
+
+    def test_consistent_reads(self):
+        source = PairDataSource()
+        config = PairConfig(data_sources=[source], singleton=False)
+
+        stop = threading.Event()
+        inconsistent = []
+
+        def read():
+            while not stop.is_set():
+                snapshot = config.snapshot()
+                if snapshot[config.FIRST] != snapshot[config.SECOND]:
+                    inconsistent.append(snapshot)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for _ in range(500):
+                config.reload()
+        finally:
+            stop.set()
+            reader.join()
+
+        self.assertEqual([], inconsistent)
+        self.assertEqual(source.counter, config.FIRST.value)
+
+    def test_failed_reload_keeps_values(self):
+        source = PairDataSource()
+        config = PairConfig(data_sources=[source], singleton=False)
+        snapshot = config.snapshot()
+
+        source.invalid = True
+        with self.assertRaises(ValueError):
+            config.reload()
+
+        self.assertIs(snapshot, config.snapshot())
+        self.assertEqual(1, config.FIRST.value)
+        self.assertEqual(1, config.SECOND.value)
+
+    def test_set_value_publishes_new_snapshot(self):
+        config = PairConfig(data_sources=[], singleton=False)
+        snapshot = config.snapshot()
+
+        config.FIRST.value = 5
+
+        self.assertEqual(0, snapshot[config.FIRST])
+        self.assertEqual(5, config.snapshot()[config.FIRST])
+        self.assertGreater(config.snapshot().generation, snapshot.generation)
+
+    def test_inherited_declarations(self):
+        parent = ParentConfig(data_sources=[])
+        child = ChildConfig(data_sources=[])
+        self.assertNotEqual(ParentConfig._entry_indices[ParentConfig.SHARED],
+                            ChildConfig._entry_indices[ChildConfig.SHARED])
+
+        child.SHARED.value = 3
+
+        self.assertEqual(1, parent.snapshot()[ParentConfig.SHARED])
+        self.assertEqual(1, parent.SHARED.value)
+        self.assertEqual(3, child.snapshot()[ChildConfig.SHARED])
+        self.assertEqual(3, child.snapshot()[child.SHARED])
+        self.assertEqual(3, child.SHARED.value)
+
+    def test_foreign_entries(self):
+        config = PairConfig(data_sources=[], singleton=False)
+        child = ChildConfig(data_sources=[], singleton=False)
+
+        # declarations can be used without any singleton
+        self.assertEqual(0, config.snapshot()[PairConfig.FIRST])
+        self.assertRaises(KeyError, lambda: config.snapshot()[ChildConfig.CHILD])
+        self.assertRaises(KeyError, lambda: config.snapshot()[child.CHILD])
@@ -0,0 +1,56 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import timeit
+import unittest
+
+from container_app_conf.entry.timedelta import parse_duration
+from tests import TestBase, benchmark
+
+DURATIONS = ["20:56:35", "32m", "4h0m3s", "4h3s", "4:13", "1 hour, 30 minutes", "2w 3d", "1.5h"]
+
+# formats documented by pytimeparse
+PYTIMEPARSE_FORMATS = [
+    "32m", "2h32m", "3d2h32m", "1w3d2h32m", "1w 3d 2h 32m", "1 w 3 d 2 h 32 m", "4:13", "4:13:02", "4:13:02.266",
+    "2:04:13:02.266", "2 days, 4:13:02", "2 days, 4:13:02.266", "5hr34m56s", "5 hours, 34 minutes, 56 seconds",
+    "5 hrs, 34 mins, 56 secs", "2 days, 5 hours, 34 minutes, 56 seconds", "1.2 m", "1.2 min", "1.2 mins",
+    "1.2 minute", "1.2 minutes", "172 hours", "172 hr", "172 h", "172 hrs", "172 hour", "1.24 days", "5 d", "5 day",
+    "5 days", "5.6 wk", "5.6 week", "5.6 weeks", ":22", "- 1 minute", "+ 1 minute",
+]
+
+
+class TestDurationParser(TestBase):
+
+    def setUp(self):
+        try:
+            from pytimeparse import parse
+        except ImportError:
+            raise unittest.SkipTest("pytimeparse is not installed")
+        self.parse = parse
+
+    def test_pytimeparse_formats(self):
+        for duration in PYTIMEPARSE_FORMATS + DURATIONS:
+            self.assertAlmostEqual(self.parse(duration), parse_duration(duration).total_seconds(), msg=duration)
+
+    @benchmark
+    def test_faster_than_pytimeparse(self):
+        def run(parser):
+            return min(timeit.repeat(lambda: list(map(parser, DURATIONS)), number=1000, repeat=5))
+
+        self.assertLess(run(parse_duration), run(self.parse))
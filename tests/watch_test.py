@@ -0,0 +1,158 @@
+#  Copyright (c) 2019 Markus Ressel
+#  .
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  .
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  .
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+from container_app_conf import ConfigBase
+from container_app_conf.entry.int import IntConfigEntry
+from container_app_conf.entry.string import StringConfigEntry
+from container_app_conf.source.json_source import JsonSource
+from container_app_conf.watch import ConfigWatcher
+from tests import TestBase
+from tests.singleton_test import CountingDataSource, TestConfigBaseReload
+
+
+class WatchedConfig(ConfigBase):
+    BOOL = TestConfigBaseReload.BOOL
+    STRING = StringConfigEntry(
+        key_path=["testing", "key1"],
+        default="default"
+    )
+    INT = IntConfigEntry(
+        key_path=["testing", "key2"],
+        default=1
+    )
+
+
+class LazyWatchedConfig(ConfigBase, lazy=True):
+    INT = IntConfigEntry(
+        key_path=["testing", "key2"],
+        default=1
+    )
+
+
+class RequiredConfig(ConfigBase):
+    REQUIRED = IntConfigEntry(
+        key_path=["testing", "required"],
+        required=True
+    )
+
+
+class TestWatch(TestBase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.config_file = Path(self._directory.name, "watched.json")
+        self.config_file.write_text('{"testing": {"key1": "value", "key2": 2}}')
+        self.memory_source = CountingDataSource()
+        self.config = WatchedConfig(data_sources=[
+            self.memory_source,
+            JsonSource("watched", self._directory.name),
+        ], singleton=False)
+        self.changes = []
+        self.config.add_change_listener(self.changes.append)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_incremental_reload(self):
+        watcher = ConfigWatcher(self.config)
+        watcher.check()
+        self.assertEqual([], self.changes)
+
+        self.config_file.write_text('{"testing": {"key1": "changed", "key2": 2, "other": true}}')
+        watcher.check()
+
+        self.assertEqual(1, self.memory_source.load_count)
+        self.assertEqual(1, len(self.changes))
+        change = self.changes[0]
+        self.assertIs(self.config.STRING, change.entry)
+        self.assertEqual("value", change.old_value)
+        self.assertEqual("changed", change.new_value)
+
+        # removed values fall back to their default
+        self.config_file.unlink()
+        watcher.check()
+        self.assertEqual(["default", 1], [self.config.STRING.value, self.config.INT.value])
+        self.assertEqual(3, len(self.changes))
+
+    def test_failed_reload(self):
+        watcher = ConfigWatcher(self.config)
+        self.config_file.write_text('{"testing": {"key1": "changed", "key2": 2}}')
+
+        with mock.patch.object(self.config, "_reload_sources", side_effect=OSError):
+            watcher.check()
+        self.assertEqual("value", self.config.STRING.value)
+
+        # the changed file is reloaded on the next check
+        watcher.check()
+        self.assertEqual("changed", self.config.STRING.value)
+
+    def test_watch(self):
+        changed = threading.Event()
+        self.config.add_change_listener(lambda x: changed.set())
+
+        watcher = self.config.watch(interval=0.05)
+        try:
+            self.config_file.write_text('{"testing": {"key1": "watched", "key2": 3}}')
+            self.assertTrue(changed.wait(5))
+        finally:
+            watcher.stop()
+
+        self.assertFalse(watcher.is_alive())
+        self.assertEqual(3, self.config.INT.value)
+
+    def test_raw_value_type_change(self):
+        self.config_file.write_text('{"testing": {"key1": 1}}')
+        self.config.reload()
+        self.assertEqual("1", self.config.STRING.value)
+
+        self.config_file.write_text('{"testing": {"key1": true}}')
+        self.config.reload()
+        self.assertEqual("True", self.config.STRING.value)
+
+    def test_validate_on_reload(self):
+        config = RequiredConfig(data_sources=[], validate=False, singleton=False)
+        self.assertIsNone(config.REQUIRED.value)
+        # unchanged values that have never been validated are validated nonetheless
+        self.assertRaises(ValueError, lambda: config.reload(validate=True))
+        self.assertRaises(ValueError, lambda: config.load_config(True))
+
+    def test_lazy_invalid_value(self):
+        config = LazyWatchedConfig(data_sources=[JsonSource("watched", self._directory.name)], singleton=False)
+        changes = []
+        config.add_change_listener(changes.append)
+        snapshot = config.snapshot()
+
+        self.config_file.write_text('{"testing": {"key2": "invalid"}}')
+        self.assertRaises(ValueError, config.reload)
+
+        # the previous values are kept
+        self.assertIs(snapshot, config.snapshot())
+        self.assertEqual(2, config.INT.value)
+        self.assertEqual([], changes)
+
+        self.config_file.write_text('{"testing": {"key2": 3}}')
+        config.reload()
+        self.assertEqual(1, len(changes))
+        self.assertEqual(2, changes[0].old_value)
+        self.assertEqual(3, changes[0].new_value)